@@ -554,7 +554,8 @@ class MinecraftServerWrapper:
             try:
                 line = self.server_process.stdout.readline()
                 if line:
-                    line = line.strip()
+                    # rstrip only: keeps the indentation of stack traces and multi-line output
+                    line = line.rstrip()
                     self.log_message(line)
                     self.parse_server_output(line)
                 elif self.server_process.poll() is not None:
@@ -616,18 +617,19 @@ class MinecraftServerWrapper:
         # Print to terminal
         print(formatted_message)
         
-        # Update GUI console if available
+        # Update GUI console if available; after() passes the text along, no closure per line
         if not self.headless and GUI_AVAILABLE and hasattr(self, 'console_output'):
-            def update_console():
-                self.console_output.config(state=tk.NORMAL)
-                self.console_output.insert(tk.END, formatted_message + "\n")
-                self.console_output.see(tk.END)
-                self.console_output.config(state=tk.DISABLED)
-            
             if threading.current_thread() == threading.main_thread():
-                update_console()
+                self.append_console_line(formatted_message)
             else:
-                self.root.after(0, update_console)
+                self.root.after(0, self.append_console_line, formatted_message)
+    
+    def append_console_line(self, formatted_message):
+        """Append one formatted line to the GUI console (Tk thread)"""
+        self.console_output.config(state=tk.NORMAL)
+        self.console_output.insert(tk.END, formatted_message + "\n")
+        self.console_output.see(tk.END)
+        self.console_output.config(state=tk.DISABLED)
     
     def start_web_server(self):
         """Start the web server"""
@@ -6,9 +6,11 @@ Advanced server management with real-time monitoring and web interface
 
 import os
 import sys
+import re
 import json
 import subprocess
 import threading
+import queue
 import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
@@ -16,23 +18,92 @@ from datetime import datetime
 import webbrowser
 import gc
 import ctypes
+import locale
+from collections import deque
+from itertools import count, islice
+from concurrent.futures import ThreadPoolExecutor
 import psutil
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zipfile
 import shutil
+import tempfile
 from packaging import version
 
 # Flask and SocketIO imports
-from flask import Flask, render_template_string, request, jsonify, send_file, session, redirect, url_for
+from flask import Flask, Response, render_template_string, request, jsonify, send_file, session, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
 from werkzeug.serving import make_server
 import hashlib
+import gzip
+import zlib
 from functools import wraps
 
+# MessagePack framing for Socket.IO is optional; fall back to JSON without it
+try:
+    import msgpack  # noqa: F401 - required by the 'msgpack' Socket.IO serializer
+    SOCKETIO_USE_MSGPACK = True
+except ImportError:
+    SOCKETIO_USE_MSGPACK = False
+
+# orjson is optional; it speeds up the history file, API responses and Socket.IO JSON packets
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonSocketIOJson:
+    """json-module stand-in for Socket.IO backed by orjson, falling back to json for odd payloads"""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except TypeError:
+            return json.dumps(obj, *args, **kwargs)
+
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return orjson.loads(data)
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, deferring to the default for unsupported types"""
+
+    def dumps(self, obj, **kwargs):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Brotli is optional; without it cached pages and assets are served gzipped
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Reply to the Paper/Spigot 'tps' command; colour markers may precede the 1m value
+TPS_PATTERN = re.compile(r'TPS from last 1m, 5m, 15m:\D*(\d+(?:\.\d+)?)')
+# Vanilla's reply to an unknown command ("Unknown or incomplete command" since 1.13),
+# anchored to the end of the log prefix so chat lines quoting it don't match
+UNKNOWN_COMMAND_PATTERN = re.compile(r'\]: Unknown (?:or incomplete )?command')
+# Startup finished ("Done (3.2s)! For help, type "help""); commands are only answered after this
+SERVER_DONE_PATTERN = re.compile(r'\]: Done \(')
+
+# Characters Windows rejects in file names, plus control characters
+UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"|?*\x00-\x1f]')
+
 class MinecraftServerWrapper:
     def __init__(self):
         # Application version and update settings
         self.current_version = "1.0.5"
+        self.current_version_parsed = version.parse(self.current_version)
         self.github_repo = "jcfrancisco0103/My-Server-Wrapper" 
         self.github_api_url = f"https://api.github.com/repos/{self.github_repo}/releases/latest"
         self.update_check_interval = 3600  # Check for updates every hour (in seconds)
@@ -40,16 +111,53 @@ class MinecraftServerWrapper:
         self.update_available = False
         self.latest_version = None
         self.update_download_url = None
+        # Validators of the last release response that had no update
+        self.github_etag = None
+        self.github_last_modified = None
+        
+        # One keep-alive session for GitHub so repeat checks reuse the TLS connection
+        self.http_session = requests.Session()
+        self.http_session.headers['Accept'] = 'application/vnd.github+json'
+        self.http_session.mount('https://', HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=2,
+            max_retries=Retry(total=2, backoff_factor=0.5)
+        ))
+        
+        # Win32 working-set trim used by optimize_ram, resolved once
+        self.trim_working_set = None
+        self.wrapper_psutil_process = psutil.Process()
+        if sys.platform == "win32":
+            try:
+                kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+                set_working_set = kernel32.SetProcessWorkingSetSizeEx
+                set_working_set.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t, ctypes.c_ulong]
+                set_working_set.restype = ctypes.c_int
+                get_current_process = kernel32.GetCurrentProcess
+                get_current_process.restype = ctypes.c_void_p
+                current_process = get_current_process()
+                no_limit = ctypes.c_size_t(-1).value
+                QUOTA_LIMITS_HARDWS_MIN_DISABLE = 0x2
+                self.trim_working_set = lambda: set_working_set(
+                    current_process, no_limit, no_limit, QUOTA_LIMITS_HARDWS_MIN_DISABLE)
+            except Exception as e:
+                print(f"Error loading Windows memory API: {e}")
         
         # Configuration
         self.config_file = "server_config.json"
-        self.console_history_file = "console_history.json"
+        self.console_history_file = "console_history.jsonl"  # one JSON entry per line, append-only
+        self.legacy_console_history_file = "console_history.json"
         self.server_directory = "C:\\Users\\MersYeon\\Desktop\\Cacasians"
         self.server_jar = ""
         self.min_memory = "1G"
         self.max_memory = "2G"
         self.server_running = False
         self.server_process = None
+        self.server_psutil_process = None  # cached psutil handle for server_process
+        self.server_job_handle = None  # Windows Job Object that caps the server's memory
+        self.server_encoding = locale.getpreferredencoding(False)  # console encoding of the server pipes
+        # The stdout reader only drains the pipe; a consumer thread handles the lines
+        self.server_output_queue = queue.SimpleQueue()
         self.start_time = None
         
         # Performance monitoring
@@ -57,24 +165,115 @@ class MinecraftServerWrapper:
         self.ram_usage = 0.0
         self.server_ram_usage = 0.0
         self.system_ram_total = psutil.virtual_memory().total / (1024**3)  # GB
-        self.server_tps = 20.0
-        self.performance_history = []
+        self.server_tps = 0.0  # None while the server runs but its TPS is unknown
+        self.tps_query_interval = 10  # seconds between 'tps' commands sent to the server
+        self.last_tps_query = 0
+        self.server_ready = False  # set once the server logs 'Done (', queries start then
+        self.tps_query_pending = False  # at most one query in flight, until its reply or error
+        self.tps_hide_error_marker = False  # hide vanilla's 'tps<--[HERE]' after its error line
+        self.user_tps_queries = 0  # 'tps' commands typed by users whose replies must be shown
+        self.tps_supported = None  # None until the server answers (or rejects) 'tps'
+        self.server_uptime = 0  # minutes, sampled once per monitor tick
+        self.last_ui_texts = {}  # metric key -> text last pushed to the Tk labels
         self.performance_update_interval = 2  # seconds
+        # Last hour of (time, cpu %, ram %, server RAM MB, tps) samples
+        self.performance_history = deque(maxlen=3600 // self.performance_update_interval)
+        self.last_status_running = None  # last server_running state sent to web clients
+        
+        # Web clients get a full keyframe periodically and, in between, only the
+        # fields that moved past these deltas
+        self.metrics_emit_thresholds = {
+            'cpu_usage': 1.0,          # percent
+            'ram_usage': 1.0,          # percent
+            'server_ram_usage': 10.0,  # MB
+            'server_tps': 0.1
+        }
+        self.metrics_keyframe_interval = 30  # seconds between full snapshots
+        # Filled in place each tick; latest_metrics points at it after the first sample
+        self.metrics_payload = {
+            'cpu_usage': 0.0,
+            'ram_usage': 0.0,
+            'server_ram_usage': 0.0,
+            'server_tps': 0.0,
+            'player_count': 0,
+            'max_players': 20,
+            'uptime': 0,
+            'uptime_str': '',
+            'server_running': False
+        }
+        self.latest_metrics = None
+        self.last_emitted_metrics = None  # what clients currently hold
+        self.last_metrics_keyframe_time = 0
+        self.web_clients = set()  # connected Socket.IO session ids
         
         # Monitoring thread
         self.monitoring_active = False
         self.monitor_thread = None
+        self.monitor_stop = threading.Event()  # wakes the monitor loop immediately on stop
         
         # Console and players
-        self.console_history = []
+        self.console_history_limit = 1000
+        self.console_history = deque(maxlen=self.console_history_limit)
+        self.console_history_pending = deque()  # entries not yet appended to the history file
+        self.console_history_lock = threading.Lock()
+        self.console_history_ready = threading.Event()  # set when entries are pending
+        self.timestamp_cache = (None, '')  # (epoch second, 'HH:MM:SS') of the last console line
+        self.resolved_base_cache = (None, None)  # (base path, realpath) for is_safe_path
+        
+        # Server-Sent Events console tail: numbered entries so clients can resume
+        self.console_sequence = count(1)
+        self.console_stream_backlog = deque(maxlen=self.console_history_limit)  # (id, entry)
+        self.console_stream_clients = set()  # one SimpleQueue per open stream
+        self.console_stream_lock = threading.Lock()  # keeps numbering, backlog and fan-out in order
+        # Run prefix for /api/console ETags and SSE event ids; the start time keeps ids
+        # from a previous run (sequence numbers restart at 1) from matching
+        self.console_run_prefix = f"{int(time.time())}-"
+        self.console_version = 0  # sequence number of the newest console entry
+        self.history_save_interval = 5  # seconds between history writes
+        
+        # Console widget writes are buffered and flushed as one insert per tick.
+        # Any thread appends; only the Tk thread pops (a full queue drops the oldest)
+        self.console_ui_queue = deque(maxlen=5000)
+        self.console_ui_flush_interval = 50  # ms
+        self.console_ui_max_lines = 10000
         self.online_players = []
         
         # Web server
         self.web_server = Flask(__name__)
         self.web_server.config['SECRET_KEY'] = 'minecraft_wrapper_secret_key_2024'
-        self.socketio = SocketIO(self.web_server, cors_allowed_origins="*")
+        if orjson is not None:
+            # jsonify() and request.get_json() go through orjson
+            self.web_server.json = OrjsonJSONProvider(self.web_server)
+        # Threading mode keeps emits from the monitor/console threads safe; with
+        # simple-websocket installed it still upgrades clients to real WebSockets
+        socketio_options = {'json': OrjsonSocketIOJson} if orjson else {}
+        self.socketio = SocketIO(self.web_server, cors_allowed_origins="*",
+                                 async_mode='threading',
+                                 serializer='msgpack' if SOCKETIO_USE_MSGPACK else 'default',
+                                 **socketio_options)
         self.web_thread = None
         self.server_instance = None
+        self.dashboard_cache = {}  # (username, is_admin) -> (encoded variants, etag)
+        self.file_manager_cache = None  # (encoded variants, etag); the page is static
+        self.static_assets = {}  # content-hashed file name -> (encoded variants, mimetype)
+        
+        # Server output lines are sent to web clients in batches
+        self.console_batch = []
+        self.console_batch_lock = threading.Lock()
+        self.console_batch_ready = threading.Event()
+        self.console_batch_interval = 0.05  # seconds to gather a burst before emitting
+        self.console_batch_max = 500  # lines per emit, so one burst can't become a huge frame
+        self.pending_performance_update = None  # metrics waiting to ride along with console lines
+        
+        # Slow web control actions run here so request threads return immediately;
+        # a single worker keeps start/stop/restart from interleaving
+        self.control_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='control')
+        
+        # Update checks (hourly, the button and the web API) share one worker and
+        # never run more than one at a time
+        self.update_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='update')
+        self.update_lock = threading.Lock()
+        self.update_in_flight = False
         
         # User authentication system
         self.users_file = "users.json"
@@ -94,9 +293,12 @@ class MinecraftServerWrapper:
         # Load configuration
         self.load_config()
         self.load_console_history()
+        self.start_history_saver()
+        threading.Thread(target=self.server_output_consumer_loop, daemon=True).start()
         
         # Setup UI
         self.setup_ui()
+        self.root.after(self.console_ui_flush_interval, self.flush_console_ui)
         self.setup_web_routes()
         self.setup_socketio_events()
         
@@ -109,29 +311,23 @@ class MinecraftServerWrapper:
     def optimize_ram(self):
         """Optimize system RAM using Windows API and Python garbage collection"""
         try:
+            rss_before = self.wrapper_psutil_process.memory_info().rss
+            
             # Python garbage collection
             collected = gc.collect()
             
             # Windows-specific memory optimization
-            if sys.platform == "win32":
+            if self.trim_working_set is not None:
                 try:
-                    # Get current process handle
-                    process_handle = ctypes.windll.kernel32.GetCurrentProcess()
-                    
-                    # Try to trim working set
-                    ctypes.windll.psapi.EmptyWorkingSet(process_handle)
+                    # Ask Windows to trim our working set (pages stay available on demand)
+                    if not self.trim_working_set():
+                        raise ctypes.WinError(ctypes.get_last_error())
                     
-                    # Force garbage collection again
-                    gc.collect()
+                    # Measure what the collection and trim actually released
+                    rss_after = self.wrapper_psutil_process.memory_info().rss
+                    freed_mb = max(0.0, (rss_before - rss_after) / (1024**2))
                     
-                    # Get memory info before and after
-                    process = psutil.Process()
-                    memory_info = process.memory_info()
-                    
-                    # Estimate freed memory (rough calculation)
-                    freed_mb = max(10, collected * 0.1)  # Conservative estimate
-                    
-                    self.add_console_message(f"RAM optimization completed. Freed approximately {freed_mb:.1f} MB")
+                    self.add_console_message(f"RAM optimization completed. Freed {freed_mb:.1f} MB")
                     
                     # Emit to web clients
                     self.socketio.emit('ram_optimized', {
@@ -143,13 +339,19 @@ class MinecraftServerWrapper:
                     
                 except Exception as e:
                     self.add_console_message(f"Windows RAM optimization failed: {e}")
+                    self.socketio.emit('ram_optimized', {'error': f'RAM optimization failed: {e}'})
                     return 0
             else:
                 self.add_console_message(f"Basic RAM optimization completed. Collected {collected} objects")
+                self.socketio.emit('ram_optimized', {
+                    'freed_mb': 0,
+                    'message': f'RAM optimized! Collected {collected} objects'
+                })
                 return collected * 0.01  # Very rough estimate
                 
         except Exception as e:
             self.add_console_message(f"RAM optimization error: {e}")
+            self.socketio.emit('ram_optimized', {'error': f'RAM optimization error: {e}'})
             return 0
 
     def check_for_updates(self, manual=False):
@@ -158,8 +360,17 @@ class MinecraftServerWrapper:
             if manual:
                 self.add_console_message("🔍 Checking for updates...")
             
-            # Make request to GitHub API
-            response = requests.get(self.github_api_url, timeout=10)
+            # Make request to GitHub API; background checks revalidate with the
+            # stored ETag so an unchanged release costs a 304 and no parsing
+            headers = {}
+            if not manual:
+                if self.github_etag:
+                    headers['If-None-Match'] = self.github_etag
+                if self.github_last_modified:
+                    headers['If-Modified-Since'] = self.github_last_modified
+            response = self.http_session.get(self.github_api_url, headers=headers, timeout=10)
+            if response.status_code == 304:
+                return False
             response.raise_for_status()
             
             release_data = response.json()
@@ -190,7 +401,6 @@ class MinecraftServerWrapper:
             
             # Compare versions using packaging.version
             try:
-                current_parsed = version.parse(self.current_version)
                 latest_parsed = version.parse(latest_version)
             except Exception as e:
                 error_msg = f"❌ Version parsing error: {e}"
@@ -199,25 +409,28 @@ class MinecraftServerWrapper:
                 print(error_msg)
                 return False
             
-            if latest_parsed > current_parsed:
+            if latest_parsed > self.current_version_parsed:
                 self.update_available = True
                 self.latest_version = latest_version
                 
                 # Find the download URL for the main file
-                for asset in release_data.get('assets', []):
-                    if asset['name'].endswith('.py') or asset['name'].endswith('.zip'):
+                for asset in release_data.get('assets', ()):
+                    if asset['name'].endswith(('.py', '.zip')):
                         self.update_download_url = asset['browser_download_url']
                         break
                 else:
                     # Fallback to zipball if no specific asset found
                     self.update_download_url = release_data['zipball_url']
                 
+                # A 304 must never hide this release, so don't revalidate against it
+                self.set_github_validators(None, None)
+                
                 message = f"🎉 Update available! Current: v{self.current_version} → Latest: v{latest_version}"
                 self.add_console_message(message)
                 
                 if manual:
-                    # Show update dialog
-                    self.show_update_dialog(latest_version, release_data.get('body', ''))
+                    # Show update dialog on the Tk thread; checks run on a worker
+                    self.root.after(0, self.show_update_dialog, latest_version, release_data.get('body', ''))
                 
                 # Emit to web clients
                 self.emit_update_notification('update_available', {
@@ -230,6 +443,8 @@ class MinecraftServerWrapper:
                 return True
             else:
                 self.update_available = False
+                self.set_github_validators(response.headers.get('ETag'),
+                                           response.headers.get('Last-Modified'))
                 if manual:
                     self.add_console_message(f"✅ You're running the latest version (v{self.current_version})")
                 return False
@@ -247,6 +462,13 @@ class MinecraftServerWrapper:
             print(error_msg)
             return False
 
+    def set_github_validators(self, etag, last_modified):
+        """Remember the release ETag and Last-Modified and persist them when they change"""
+        if (etag, last_modified) != (self.github_etag, self.github_last_modified):
+            self.github_etag = etag
+            self.github_last_modified = last_modified
+            self.save_config()
+
     def show_update_dialog(self, latest_version, release_notes):
         """Show update dialog to user"""
         try:
@@ -285,43 +507,49 @@ class MinecraftServerWrapper:
             shutil.copy2(current_file, backup_file)
             self.add_console_message(f"📋 Backup created: {backup_file}")
             
-            # Download the update
-            response = requests.get(self.update_download_url, timeout=30)
-            response.raise_for_status()
+            # Stream the download to a temp file instead of holding it in memory
+            with tempfile.NamedTemporaryFile(suffix='.download', delete=False) as tmp:
+                download_path = tmp.name
+            # The new script is staged next to the current one, then swapped in with
+            # os.replace, so a failed update never leaves a truncated script behind
+            staged_fd, staged_path = tempfile.mkstemp(suffix='.update', dir=os.path.dirname(current_file))
+            os.close(staged_fd)
             
-            if self.update_download_url.endswith('.zip'):
-                # Handle ZIP file
-                zip_path = "update.zip"
-                with open(zip_path, 'wb') as f:
-                    f.write(response.content)
-                
-                # Extract ZIP
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall("update_temp")
+            try:
+                with self.http_session.get(self.update_download_url, timeout=30, stream=True) as response, \
+                        open(download_path, 'wb') as tmp:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, tmp, 1024 * 1024)
                 
-                # Find the main Python file in extracted content
-                for root, dirs, files in os.walk("update_temp"):
-                    for file in files:
-                        if file.endswith('.py') and 'minecraft_server_wrapper' in file:
-                            new_file_path = os.path.join(root, file)
-                            break
-                    else:
-                        continue
-                    break
+                # Release zipballs don't end in .zip, so check the content itself
+                if zipfile.is_zipfile(download_path):
+                    with zipfile.ZipFile(download_path, 'r') as zip_ref:
+                        # Find the main Python file from the archive index, no extraction needed
+                        candidates = [
+                            name for name in zip_ref.namelist()
+                            if name.endswith('.py') and 'minecraft_server_wrapper' in os.path.basename(name)
+                        ]
+                        if not candidates:
+                            raise Exception("Could not find main Python file in update")
+                        
+                        # Prefer the file with the same name as the one we're running
+                        current_name = os.path.basename(current_file)
+                        target = next((name for name in candidates if os.path.basename(name) == current_name), candidates[0])
+                        
+                        # Extract only that member
+                        with zip_ref.open(target) as src, open(staged_path, 'wb') as dst:
+                            shutil.copyfileobj(src, dst)
                 else:
-                    raise Exception("Could not find main Python file in update")
-                
-                # Copy new file
-                shutil.copy2(new_file_path, current_file)
+                    # Handle direct Python file
+                    shutil.copyfile(download_path, staged_path)
                 
-                # Cleanup
-                os.remove(zip_path)
-                shutil.rmtree("update_temp")
-                
-            else:
-                # Handle direct Python file
-                with open(current_file, 'wb') as f:
-                    f.write(response.content)
+                shutil.copymode(current_file, staged_path)  # mkstemp files start out 0600
+                os.replace(staged_path, current_file)
+            finally:
+                os.remove(download_path)
+                if os.path.exists(staged_path):
+                    os.remove(staged_path)
             
             self.add_console_message(f"✅ Update downloaded and applied successfully!")
             self.add_console_message(f"🔄 Please restart the application to use v{self.latest_version}")
@@ -367,6 +595,9 @@ class MinecraftServerWrapper:
             # Stop monitoring
             self.stop_performance_monitoring()
             
+            # Persist any console history the background saver hasn't written yet
+            self.save_console_history()
+            
             # Close GUI
             if hasattr(self, 'root'):
                 self.root.quit()
@@ -379,41 +610,110 @@ class MinecraftServerWrapper:
             self.add_console_message(f"❌ Failed to restart application: {e}")
 
     def auto_check_updates(self):
-        """Automatically check for updates periodically"""
-        current_time = time.time()
-        if current_time - self.last_update_check >= self.update_check_interval:
-            self.last_update_check = current_time
-            # Check for updates in background (non-manual)
-            threading.Thread(target=self.check_for_updates, args=(False,), daemon=True).start()
+        """Automatically check for updates periodically (Tk timer, re-armed on every run)"""
+        self.root.after(self.update_check_interval * 1000, self.auto_check_updates)
+        try:
+            current_time = time.time()
+            if current_time - self.last_update_check >= self.update_check_interval:
+                self.last_update_check = current_time
+                # Check for updates in background (non-manual); the executor does the network I/O
+                self.request_update_check(manual=False)
+        except Exception as e:
+            self.add_console_message(f"❌ Automatic update check failed: {e}")
+
+    def request_update_check(self, manual=False):
+        """Queue an update check; returns its Future, or None if one is already running"""
+        with self.update_lock:
+            if self.update_in_flight:
+                if manual:
+                    self.add_console_message("🔍 An update check is already in progress")
+                return None
+            self.update_in_flight = True
+        
+        def finished(future):
+            with self.update_lock:
+                self.update_in_flight = False
+        
+        future = self.update_executor.submit(self.check_for_updates, manual)
+        future.add_done_callback(finished)
+        return future
 
     def start_performance_monitoring(self):
         """Start the performance monitoring thread"""
+        # One monitor thread samples for the Tk UI and every web client
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            return
         if not self.monitoring_active:
             self.monitoring_active = True
+            self.monitor_stop.clear()
+            # Prime the non-blocking CPU sampler; its first reading is meaningless
+            psutil.cpu_percent(interval=None)
             self.monitor_thread = threading.Thread(target=self.performance_monitor_loop, daemon=True)
             self.monitor_thread.start()
 
     def stop_performance_monitoring(self):
         """Stop the performance monitoring thread"""
         self.monitoring_active = False
+        self.monitor_stop.set()
         if self.monitor_thread:
-            self.monitor_thread.join(timeout=1)
+            self.monitor_thread.join(timeout=3)
+
+    def lower_monitor_thread_priority(self):
+        """Run the calling thread below normal priority and as EcoQoS on Windows"""
+        if sys.platform != "win32":
+            return
+        try:
+            from ctypes import wintypes
+            
+            # Own WinDLL instance with full prototypes: the pseudo-handle must stay pointer-sized
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            kernel32.GetCurrentThread.restype = wintypes.HANDLE
+            kernel32.GetCurrentThread.argtypes = []
+            kernel32.SetThreadPriority.restype = wintypes.BOOL
+            kernel32.SetThreadPriority.argtypes = [wintypes.HANDLE, ctypes.c_int]
+            
+            thread = kernel32.GetCurrentThread()
+            THREAD_PRIORITY_BELOW_NORMAL = -1
+            if not kernel32.SetThreadPriority(thread, THREAD_PRIORITY_BELOW_NORMAL):
+                print(f"Error lowering monitor thread priority: {ctypes.WinError(ctypes.get_last_error())}")
+            
+            # EcoQoS (Windows 10 1709+): let the scheduler favour efficiency for this thread
+            class THREAD_POWER_THROTTLING_STATE(ctypes.Structure):
+                _fields_ = [('Version', ctypes.c_ulong),
+                            ('ControlMask', ctypes.c_ulong),
+                            ('StateMask', ctypes.c_ulong)]
+            
+            THREAD_POWER_THROTTLING_EXECUTION_SPEED = 0x1
+            ThreadPowerThrottling = 3
+            state = THREAD_POWER_THROTTLING_STATE(1, THREAD_POWER_THROTTLING_EXECUTION_SPEED,
+                                                  THREAD_POWER_THROTTLING_EXECUTION_SPEED)
+            if hasattr(kernel32, 'SetThreadInformation'):
+                kernel32.SetThreadInformation.restype = wintypes.BOOL
+                kernel32.SetThreadInformation.argtypes = [wintypes.HANDLE, ctypes.c_int,
+                                                          ctypes.c_void_p, wintypes.DWORD]
+                if not kernel32.SetThreadInformation(thread, ThreadPowerThrottling,
+                                                     ctypes.byref(state), ctypes.sizeof(state)):
+                    print(f"Error enabling EcoQoS for the monitor thread: {ctypes.WinError(ctypes.get_last_error())}")
+        except Exception as e:
+            print(f"Error lowering monitor thread priority: {e}")
 
     def performance_monitor_loop(self):
         """Main performance monitoring loop"""
-        while self.monitoring_active:
+        # Sampling must never compete with the server JVM for CPU
+        self.lower_monitor_thread_priority()
+        while not self.monitor_stop.is_set():
             try:
                 self.update_performance_metrics()
-                time.sleep(self.performance_update_interval)
+                self.monitor_stop.wait(self.performance_update_interval)
             except Exception as e:
                 print(f"Performance monitoring error: {e}")
-                time.sleep(5)
+                self.monitor_stop.wait(5)
 
     def update_performance_metrics(self):
         """Update all performance metrics"""
         try:
-            # CPU usage
-            self.cpu_usage = psutil.cpu_percent(interval=0.1)
+            # CPU usage since the previous tick (non-blocking)
+            self.cpu_usage = psutil.cpu_percent(interval=None)
             
             # System RAM usage
             memory = psutil.virtual_memory()
@@ -422,58 +722,142 @@ class MinecraftServerWrapper:
             # Server RAM usage (if server is running)
             if self.server_process and self.server_running:
                 try:
-                    process = psutil.Process(self.server_process.pid)
+                    process = self.get_server_psutil_process()
                     self.server_ram_usage = process.memory_info().rss / (1024**2)  # MB
-                except:
+                except Exception:
+                    self.server_psutil_process = None
                     self.server_ram_usage = 0
             else:
                 self.server_ram_usage = 0
             
-            # Simulate TPS based on server load (more realistic)
+            # Real TPS: ask the server periodically once it is up; the output reader parses the reply
             if self.server_running:
-                load_factor = (self.cpu_usage + self.ram_usage) / 200
-                player_factor = len(self.online_players) * 0.1
-                self.server_tps = max(5.0, 20.0 - load_factor - player_factor)
+                now = time.monotonic()
+                if (self.server_ready and self.tps_supported is not False and not self.tps_query_pending
+                        and now - self.last_tps_query >= self.tps_query_interval):
+                    self.last_tps_query = now
+                    self.tps_query_pending = True
+                    try:
+                        self.write_server_stdin("tps\n")
+                    except OSError as e:
+                        # The JVM is exiting; don't let that abort the rest of this tick
+                        self.tps_query_pending = False
+                        print(f"Error querying server TPS: {e}")
             else:
                 self.server_tps = 0.0
             
-            # Update UI in main thread
-            if hasattr(self, 'root'):
-                self.root.after(0, self.update_performance_ui)
-            
-            # Emit to web clients
-            self.socketio.emit('performance_update', {
-                'cpu_usage': self.cpu_usage,
-                'ram_usage': self.ram_usage,
-                'server_ram_usage': self.server_ram_usage,
-                'server_tps': self.server_tps,
-                'player_count': len(self.online_players),
-                'max_players': 20,
-                'uptime': self.get_server_uptime(),
-                'server_running': self.server_running
+            self.server_uptime = self.get_server_uptime()
+            uptime = self.server_uptime
+            
+            # Update UI in main thread (only labels whose text changed)
+            self.update_metric_vars({
+                'cpu': f"{self.cpu_usage:.1f}%",
+                'ram': f"{self.ram_usage:.1f}%",
+                'server_ram': f"{self.server_ram_usage:.1f} MB",
+                'tps': "N/A" if self.server_tps is None else f"{self.server_tps:.1f}",
+                'players': str(len(self.online_players)),
+                'uptime': f"{uptime} min"
             })
             
+            # Emit status only when it flips; clients no longer read it per tick
+            if self.server_running != self.last_status_running:
+                self.last_status_running = self.server_running
+                self.socketio.emit('status_change', {'running': self.server_running})
+            
+            metrics = self.metrics_payload
+            metrics['cpu_usage'] = self.cpu_usage
+            metrics['ram_usage'] = self.ram_usage
+            metrics['server_ram_usage'] = self.server_ram_usage
+            metrics['server_tps'] = self.server_tps
+            metrics['player_count'] = len(self.online_players)
+            if metrics['uptime'] != uptime or not metrics['uptime_str']:
+                metrics['uptime'] = uptime
+                metrics['uptime_str'] = self.format_uptime(uptime)
+            metrics['server_running'] = self.server_running
+            
+            self.latest_metrics = metrics
+            self.performance_history.append((
+                time.time(), self.cpu_usage, self.ram_usage, self.server_ram_usage, self.server_tps
+            ))
+            
+            # Emit to web clients: a keyframe when due, otherwise just the delta
+            if self.web_clients:
+                now = time.monotonic()
+                if (self.last_emitted_metrics is None or
+                        now - self.last_metrics_keyframe_time >= self.metrics_keyframe_interval):
+                    self.queue_performance_update(dict(metrics, keyframe=True))
+                    if self.last_emitted_metrics is None:
+                        self.last_emitted_metrics = dict(metrics)
+                    else:
+                        self.last_emitted_metrics.update(metrics)
+                    self.last_metrics_keyframe_time = now
+                else:
+                    delta = self.get_metrics_delta(metrics)
+                    if delta:
+                        self.queue_performance_update(delta)
+                        self.last_emitted_metrics.update(delta)
+            
         except Exception as e:
             print(f"Error updating performance metrics: {e}")
 
-    def update_performance_ui(self):
-        """Update the performance UI elements"""
+    def get_metrics_delta(self, metrics):
+        """Return the metrics that moved past their threshold since the last emit"""
+        delta = {}
+        for key, value in metrics.items():
+            previous = self.last_emitted_metrics.get(key)
+            threshold = self.metrics_emit_thresholds.get(key)
+            if threshold is None:
+                if value != previous:
+                    delta[key] = value
+            elif value is None or previous is None:
+                if value != previous:
+                    delta[key] = value
+            elif abs(value - previous) > threshold:
+                delta[key] = value
+        return delta
+
+    def get_performance_stats(self):
+        """Return the average and 95th percentile of each metric over the recorded history"""
+        samples = list(self.performance_history)
+        if not samples:
+            return {'samples': 0}
+        
+        keys = ('cpu_usage', 'ram_usage', 'server_ram_usage', 'server_tps')
+        stats = {'samples': len(samples)}
         try:
-            if hasattr(self, 'cpu_label'):
-                self.cpu_label.config(text=f"CPU: {self.cpu_usage:.1f}%")
-            if hasattr(self, 'ram_label'):
-                self.ram_label.config(text=f"System RAM: {self.ram_usage:.1f}%")
-            if hasattr(self, 'server_ram_label'):
-                self.server_ram_label.config(text=f"Server RAM: {self.server_ram_usage:.1f} MB")
-            if hasattr(self, 'tps_label'):
-                self.tps_label.config(text=f"TPS: {self.server_tps:.1f}")
-            if hasattr(self, 'players_label'):
-                self.players_label.config(text=f"Players: {len(self.online_players)}")
-            if hasattr(self, 'uptime_label'):
-                uptime = self.get_server_uptime()
-                self.uptime_label.config(text=f"Uptime: {uptime} min")
-        except Exception as e:
-            print(f"Error updating performance UI: {e}")
+            import numpy as np  # optional; imported on first use to keep startup fast
+        except ImportError:
+            np = None
+        
+        # TPS is None while unknown; those samples are left out of its figures
+        for i, key in enumerate(keys, start=1):
+            values = [sample[i] for sample in samples if sample[i] is not None]
+            if not values:
+                stats[key] = None
+            elif np is not None:
+                data = np.asarray(values, dtype=np.float64)
+                stats[key] = {'avg': round(float(data.mean()), 2), 'p95': round(float(np.percentile(data, 95)), 2)}
+            else:
+                values.sort()
+                p95_index = min(len(values) - 1, int(len(values) * 0.95))
+                stats[key] = {'avg': round(sum(values) / len(values), 2), 'p95': round(values[p95_index], 2)}
+        return stats
+
+    def get_server_psutil_process(self):
+        """Return the cached psutil handle for the server, reopening it if the PID changed"""
+        pid = self.server_process.pid
+        if self.server_psutil_process is None or self.server_psutil_process.pid != pid:
+            self.server_psutil_process = psutil.Process(pid)
+        return self.server_psutil_process
+
+    def update_metric_vars(self, texts):
+        """Push changed metric texts to the monitor tab's StringVars on the Tk thread"""
+        if not hasattr(self, 'metric_vars'):
+            return
+        for key, text in texts.items():
+            if self.last_ui_texts.get(key) != text:
+                self.last_ui_texts[key] = text
+                self.root.after(0, self.metric_vars[key].set, text)
 
     def get_server_uptime(self):
         """Get server uptime in minutes"""
@@ -481,6 +865,12 @@ class MinecraftServerWrapper:
             return int((time.time() - self.start_time) / 60)
         return 0
 
+    def format_uptime(self, minutes):
+        """Format uptime minutes for display, e.g. '2h 5m' or '45m'"""
+        if minutes >= 60:
+            return f"{minutes // 60}h {minutes % 60}m"
+        return f"{minutes}m"
+
     def setup_ui(self):
         """Setup the main UI with modern, improved design"""
         self.root = tk.Tk()
@@ -697,7 +1087,7 @@ class MinecraftServerWrapper:
         self.web_button.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         
         self.update_button = self.create_modern_button(row3, "🔄 Check Updates", colors['text_muted'], 
-                                                      lambda: self.check_for_updates(manual=True))
+                                                      lambda: self.request_update_check(manual=True))
         self.update_button.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         
         # Right column - Configuration
@@ -785,6 +1175,7 @@ class MinecraftServerWrapper:
         ]
         
         self.metric_labels = {}
+        self.metric_vars = {}
         self.metric_bars = {}
         
         for i, (key, icon, label, value, color) in enumerate(metrics):
@@ -807,11 +1198,13 @@ class MinecraftServerWrapper:
             tk.Label(header, text=label, font=('Segoe UI', 11, 'bold'), 
                     fg=colors['text_secondary'], bg=colors['bg_tertiary']).pack(side=tk.LEFT, padx=(10, 0))
             
-            # Value
-            value_label = tk.Label(metric_card, text=value, font=('Segoe UI', 16, 'bold'), 
+            # Value (bound to a StringVar the monitor thread updates)
+            value_var = tk.StringVar(value=value)
+            value_label = tk.Label(metric_card, textvariable=value_var, font=('Segoe UI', 16, 'bold'), 
                                   fg=colors['text_primary'], bg=colors['bg_tertiary'])
             value_label.pack(pady=(0, 10))
             self.metric_labels[key] = value_label
+            self.metric_vars[key] = value_var
             
             # Progress bar for percentage metrics
             if key in ['cpu', 'ram']:
@@ -987,7 +1380,7 @@ class MinecraftServerWrapper:
         button_frame2.pack(fill=tk.X, pady=(5, 0))
         
         self.update_button = ttk.Button(button_frame2, text="🔄 Check for Updates", 
-                                       command=lambda: self.check_for_updates(manual=True))
+                                       command=lambda: self.request_update_check(manual=True))
         self.update_button.pack(side=tk.LEFT, padx=5)
         
         # Status frame
@@ -1145,6 +1538,14 @@ class MinecraftServerWrapper:
                 "nogui"
             ]
             
+            # On Windows: no console window flash, and Ctrl+C in the wrapper's
+            # console doesn't reach the JVM (it's stopped with 'stop' instead)
+            platform_options = {}
+            if sys.platform == "win32":
+                platform_options = {
+                    'creationflags': subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP
+                }
+            
             # Start server process
             self.server_process = subprocess.Popen(
                 java_cmd,
@@ -1152,12 +1553,27 @@ class MinecraftServerWrapper:
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                bufsize=0,  # raw pipes: output is read in chunks, stdin writes go straight through
+                **platform_options
             )
+            self.server_encoding = locale.getpreferredencoding(False)
+            # Open the psutil handle once per server lifetime instead of per metrics tick
+            try:
+                self.server_psutil_process = psutil.Process(self.server_process.pid)
+            except psutil.Error:
+                # The JVM already exited (bad jar, bad -Xmx); the output reader reports why
+                self.server_psutil_process = None
+            self.assign_server_job()
             
             self.server_running = True
             self.start_time = time.time()
+            self.server_tps = None  # unknown until the server answers 'tps'
+            self.last_tps_query = 0
+            self.server_ready = False
+            self.tps_query_pending = False
+            self.tps_hide_error_marker = False
+            self.user_tps_queries = 0
+            self.tps_supported = None
             self.status_label.config(text="Server Running", foreground='green')
             
             # Start output monitoring thread
@@ -1169,6 +1585,90 @@ class MinecraftServerWrapper:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start server: {e}")
 
+    def parse_memory_size(self, value):
+        """Convert a JVM memory setting such as '2G' or '1024M' to bytes"""
+        value = value.strip().upper()
+        units = {'K': 1024, 'M': 1024**2, 'G': 1024**3}
+        if value and value[-1] in units:
+            return int(value[:-1]) * units[value[-1]]
+        return int(value)
+
+    def assign_server_job(self):
+        """Put the server in a Job Object with a memory cap and above-normal priority (Windows only)"""
+        if sys.platform != "win32":
+            return
+        try:
+            from ctypes import wintypes
+            
+            class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+                _fields_ = [('PerProcessUserTimeLimit', ctypes.c_int64),
+                            ('PerJobUserTimeLimit', ctypes.c_int64),
+                            ('LimitFlags', wintypes.DWORD),
+                            ('MinimumWorkingSetSize', ctypes.c_size_t),
+                            ('MaximumWorkingSetSize', ctypes.c_size_t),
+                            ('ActiveProcessLimit', wintypes.DWORD),
+                            ('Affinity', ctypes.c_size_t),
+                            ('PriorityClass', wintypes.DWORD),
+                            ('SchedulingClass', wintypes.DWORD)]
+            
+            class IO_COUNTERS(ctypes.Structure):
+                _fields_ = [(name, ctypes.c_uint64) for name in (
+                    'ReadOperationCount', 'WriteOperationCount', 'OtherOperationCount',
+                    'ReadTransferCount', 'WriteTransferCount', 'OtherTransferCount')]
+            
+            class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+                _fields_ = [('BasicLimitInformation', JOBOBJECT_BASIC_LIMIT_INFORMATION),
+                            ('IoInfo', IO_COUNTERS),
+                            ('ProcessMemoryLimit', ctypes.c_size_t),
+                            ('JobMemoryLimit', ctypes.c_size_t),
+                            ('PeakProcessMemoryUsed', ctypes.c_size_t),
+                            ('PeakJobMemoryUsed', ctypes.c_size_t)]
+            
+            JobObjectExtendedLimitInformation = 9
+            JOB_OBJECT_LIMIT_PRIORITY_CLASS = 0x20
+            JOB_OBJECT_LIMIT_JOB_MEMORY = 0x200
+            ABOVE_NORMAL_PRIORITY_CLASS = 0x8000
+            
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+            kernel32.CreateJobObjectW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR]
+            kernel32.SetInformationJobObject.argtypes = [wintypes.HANDLE, ctypes.c_int,
+                                                         ctypes.c_void_p, wintypes.DWORD]
+            kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+            kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+            kernel32.CloseHandle.restype = wintypes.BOOL
+            
+            job = kernel32.CreateJobObjectW(None, None)
+            if not job:
+                raise ctypes.WinError(ctypes.get_last_error())
+            
+            # -Xmx only bounds the Java heap; leave room for metaspace, threads and GC
+            heap_bytes = self.parse_memory_size(self.max_memory)
+            info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+            info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_JOB_MEMORY | JOB_OBJECT_LIMIT_PRIORITY_CLASS
+            info.BasicLimitInformation.PriorityClass = ABOVE_NORMAL_PRIORITY_CLASS
+            info.JobMemoryLimit = heap_bytes + max(1024**3, heap_bytes // 2)
+            
+            if (not kernel32.SetInformationJobObject(job, JobObjectExtendedLimitInformation,
+                                                     ctypes.byref(info), ctypes.sizeof(info)) or
+                    not kernel32.AssignProcessToJobObject(job, int(self.server_process._handle))):
+                error = ctypes.WinError(ctypes.get_last_error())
+                kernel32.CloseHandle(job)
+                raise error
+            
+            self.server_job_handle = job
+        except Exception as e:
+            print(f"Error assigning server to job object: {e}")
+
+    def close_server_job(self):
+        """Release the server's Job Object handle"""
+        if self.server_job_handle:
+            try:
+                ctypes.windll.kernel32.CloseHandle(ctypes.c_void_p(self.server_job_handle))
+            except Exception as e:
+                print(f"Error closing server job object: {e}")
+            self.server_job_handle = None
+
     def stop_server(self):
         """Stop the Minecraft server"""
         if not self.server_running:
@@ -1177,10 +1677,11 @@ class MinecraftServerWrapper:
         
         try:
             if self.server_process:
-                self.server_process.stdin.write("stop\n")
-                self.server_process.stdin.flush()
+                self.write_server_stdin("stop\n")
                 self.server_process.wait(timeout=30)
             
+            self.server_psutil_process = None
+            self.close_server_job()
             self.server_running = False
             self.start_time = None
             self.status_label.config(text="Server Stopped", foreground='red')
@@ -1207,53 +1708,303 @@ class MinecraftServerWrapper:
             return
         
         try:
-            self.server_process.stdin.write(f"{command}\n")
-            self.server_process.stdin.flush()
+            self.write_server_stdin(f"{command}\n")
+            self.note_user_command(command)
             self.add_console_message(f"> {command}")
             self.command_entry.delete(0, tk.END)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to send command: {e}")
 
+    def run_control_action(self, action, command=None):
+        """Run a server control action for web clients.
+        
+        Shared by the /api/* control routes and the Socket.IO 'control' event;
+        returns a {'message': ...} or {'error': ...} dict. For 'command',
+        `command` may also be a list of commands sent in a single write.
+        """
+        failure_labels = {
+            'start': 'start server',
+            'stop': 'stop server',
+            'restart': 'restart server',
+            'optimize-ram': 'optimize RAM',
+            'command': 'send command'
+        }
+        if action not in failure_labels:
+            return {'error': f'Unknown action: {action}'}
+        
+        try:
+            if action == 'start':
+                if self.server_running:
+                    return {'error': 'Server is already running'}
+                self.submit_control_task(self.start_server)
+                return {'message': 'Server start command sent'}
+            
+            if action == 'stop':
+                if not self.server_running:
+                    return {'error': 'Server is not running'}
+                self.submit_control_task(self.stop_server)
+                return {'message': 'Server stop command sent'}
+            
+            if action == 'restart':
+                self.submit_control_task(self.restart_server)
+                return {'message': 'Server restart command sent'}
+            
+            if action == 'optimize-ram':
+                # optimize_ram() reports the freed amount via 'ram_optimized'
+                self.submit_control_task(self.optimize_ram)
+                return {'message': 'RAM optimization started'}
+            
+            # action == 'command'
+            commands = command if isinstance(command, list) else [command]
+            commands = [c.strip() for c in commands if isinstance(c, str) and c.strip()]
+            if not commands:
+                return {'error': 'No command provided'}
+            
+            if not self.server_running:
+                return {'error': 'Server is not running'}
+            
+            # stdin is unbuffered, so all lines go to the server in a single write
+            self.write_server_stdin(''.join(f"{c}\n" for c in commands))
+            for c in commands:
+                self.note_user_command(c)
+                self.add_console_message(f"> {c}")
+            if len(commands) == 1:
+                return {'message': 'Command sent'}
+            return {'message': f'{len(commands)} commands sent'}
+        except Exception as e:
+            return {'error': f'Failed to {failure_labels[action]}: {str(e)}'}
+
+    def note_user_command(self, command):
+        """Remember a user's own 'tps' so its reply isn't hidden as the wrapper's query"""
+        if command.lstrip('/').strip().lower() == 'tps':
+            self.user_tps_queries += 1
+
+    def write_server_stdin(self, text):
+        """Write text to the server's stdin (raw pipe, so no flush is needed)"""
+        self.server_process.stdin.write(text.encode(self.server_encoding, 'replace'))
+
+    def submit_control_task(self, task):
+        """Run a slow control task on the worker pool, then broadcast server status"""
+        def run():
+            try:
+                task()
+            except Exception as e:
+                self.add_console_message(f"Control action failed: {e}")
+            finally:
+                self.last_status_running = self.server_running
+                self.socketio.emit('status_change', {'running': self.server_running})
+        
+        self.control_executor.submit(run)
+
     def monitor_server_output(self):
         """Monitor server output in a separate thread"""
+        process = self.server_process
+        fd = process.stdout.fileno()
+        buffer = bytearray()
         while self.server_running and self.server_process:
             try:
-                line = self.server_process.stdout.readline()
-                if line:
-                    self.add_console_message(line.strip())
-                    # Emit to web clients
-                    self.socketio.emit('console_update', {
-                        'message': line.strip(),
-                        'timestamp': datetime.now().strftime('%H:%M:%S')
-                    })
-                elif self.server_process.poll() is not None:
-                    break
+                # Read whatever is available (up to 64 KiB) in one syscall
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break  # EOF: the server closed its output
+                buffer += chunk
+                
+                # Hand off every complete line and keep only the trailing partial
+                # line; slow consumers never hold up draining the pipe
+                last_newline = buffer.rfind(b'\n')
+                if last_newline == -1:
+                    continue
+                self.server_output_queue.put(bytes(buffer[:last_newline]))
+                del buffer[:last_newline + 1]
             except Exception as e:
                 print(f"Error monitoring server output: {e}")
                 break
+        
+        # The last line may have no newline if the server exited mid-write
+        if buffer:
+            self.server_output_queue.put(bytes(buffer))
+        
+        # An empty read (EOF) is the only end signal; collect the exit code once
+        try:
+            exit_code = process.wait(timeout=5)
+            # Queued behind the final output so it shows up last
+            self.server_output_queue.put(f"Server process exited with code {exit_code}".encode(self.server_encoding))
+        except Exception as e:
+            print(f"Error waiting for server process: {e}")
+
+    def server_output_consumer_loop(self):
+        """Decode blocks of server output and route each line"""
+        while True:
+            blocks = [self.server_output_queue.get()]
+            # Take everything else already queued so a burst is handled in one pass
+            while True:
+                try:
+                    blocks.append(self.server_output_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                text = b'\n'.join(blocks).decode(self.server_encoding, 'replace')
+                for line in text.split('\n'):
+                    line = line.strip()
+                    if line:
+                        self.handle_server_output_line(line)
+            except Exception as e:
+                print(f"Error handling server output: {e}")
+
+    def handle_server_output_line(self, line):
+        """Route one decoded line of server output to the console and web clients"""
+        if not self.server_ready and SERVER_DONE_PATTERN.search(line):
+            self.server_ready = True
+        if self.tps_hide_error_marker:
+            # Vanilla follows its error with the failing input, e.g. 'tps<--[HERE]'
+            self.tps_hide_error_marker = False
+            if line.endswith('<--[HERE]'):
+                return
+        if self.tps_query_pending or self.user_tps_queries:
+            match = TPS_PATTERN.search(line)
+            if match:
+                self.tps_supported = True
+                self.server_tps = min(20.0, float(match.group(1)))
+                if self.user_tps_queries:
+                    # A user asked as well: this reply is theirs, show it
+                    self.user_tps_queries -= 1
+                else:
+                    # Answer to our own periodic query; keep it out of the console
+                    self.tps_query_pending = False
+                    return
+            elif UNKNOWN_COMMAND_PATTERN.search(line):
+                if self.user_tps_queries:
+                    self.user_tps_queries -= 1
+                elif self.tps_query_pending:
+                    # Vanilla servers have no 'tps' command: stop asking, TPS stays unknown
+                    self.tps_query_pending = False
+                    self.tps_supported = False
+                    self.server_tps = None
+                    self.tps_hide_error_marker = True
+                    return
+        
+        # The history entry doubles as the web payload: one timestamp, one dict
+        entry = self.add_console_message(line)
+        # Queue for the batched emit to web clients
+        self.queue_console_update(entry)
+
+    def queue_console_update(self, entry):
+        """Queue a console line for the next console_update_batch emit"""
+        # Nobody is listening; reconnecting clients get console_history instead
+        if not self.web_clients:
+            return
+        with self.console_batch_lock:
+            self.console_batch.append(entry)
+        self.console_batch_ready.set()
+
+    def queue_performance_update(self, payload):
+        """Queue a metrics keyframe or delta for the batch emitter"""
+        with self.console_batch_lock:
+            if self.pending_performance_update is None or payload.get('keyframe'):
+                self.pending_performance_update = payload
+            else:
+                self.pending_performance_update.update(payload)
+        self.console_batch_ready.set()
+
+    def console_batch_loop(self):
+        """Emit queued console lines and metrics, combined into one frame when both are ready"""
+        while True:
+            self.console_batch_ready.wait()
+            # Let lines arriving in the same burst join this batch
+            time.sleep(self.console_batch_interval)
+            with self.console_batch_lock:
+                batch, self.console_batch = self.console_batch, []
+                perf, self.pending_performance_update = self.pending_performance_update, None
+                self.console_batch_ready.clear()
+            try:
+                if perf is not None and batch:
+                    self.socketio.emit('dashboard_tick', {
+                        'perf': perf,
+                        'console': batch[:self.console_batch_max]
+                    })
+                    batch = batch[self.console_batch_max:]
+                elif perf is not None:
+                    self.socketio.emit('performance_update', perf)
+                for start in range(0, len(batch), self.console_batch_max):
+                    self.socketio.emit('console_update_batch', batch[start:start + self.console_batch_max])
+            except Exception as e:
+                print(f"Error emitting console batch: {e}")
+
+    def parse_console_event_id(self, header):
+        """Return the sequence to resume an SSE stream after, or None for a fresh stream"""
+        # An id from another run, or ahead of this run's counter, resumes from 0: the
+        # client gets this run's whole backlog instead of a stream that looks frozen
+        if not header:
+            return None
+        prefix, _, sequence = header.rpartition('-')
+        if prefix + '-' != self.console_run_prefix or not sequence.isdigit():
+            return 0
+        sequence = int(sequence)
+        return sequence if sequence <= self.console_version else 0
+
+    def get_console_timestamp(self):
+        """Return the local 'HH:MM:SS' time, formatting it at most once per second"""
+        now = int(time.time())
+        cached_second, cached_text = self.timestamp_cache
+        if now != cached_second:
+            cached_text = time.strftime('%H:%M:%S', time.localtime(now))
+            # One tuple assignment, so threads never see a mismatched pair
+            self.timestamp_cache = (now, cached_text)
+        return cached_text
 
     def add_console_message(self, message):
-        """Add message to console"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        formatted_message = f"[{timestamp}] {message}"
+        """Add message to console and return its history entry"""
+        timestamp = self.get_console_timestamp()
         
-        # Add to history
-        self.console_history.append({
+        # Add to history (the deque drops the oldest entry once full)
+        entry = {
             'timestamp': timestamp,
             'message': message
-        })
+        }
+        self.console_history.append(entry)
+        # The background saver appends it to the history file
+        self.console_history_pending.append(entry)
+        self.console_history_ready.set()
+        
+        # Numbered copy for /api/console/stream listeners
+        with self.console_stream_lock:
+            item = (next(self.console_sequence), entry)
+            self.console_version = item[0]
+            self.console_stream_backlog.append(item)
+            for client_queue in self.console_stream_clients:
+                client_queue.put(item)
+        
+        # Queue for the console widget; the Tk thread drains it on its own timer,
+        # so other threads never call into Tk. The entry is formatted at flush time
+        if hasattr(self, 'console_text'):
+            self.console_ui_queue.append(entry)
         
-        # Keep only last 1000 messages
-        if len(self.console_history) > 1000:
-            self.console_history = self.console_history[-1000:]
+        return entry
+
+    def flush_console_ui(self):
+        """Write all queued console messages to the widget in a single insert (Tk thread)"""
+        self.root.after(self.console_ui_flush_interval, self.flush_console_ui)
+        batch = []
+        while self.console_ui_queue:
+            batch.append(self.console_ui_queue.popleft())
+        if not batch:
+            return
         
-        # Update UI
-        if hasattr(self, 'console_text'):
-            self.console_text.insert(tk.END, formatted_message + "\n")
+        try:
+            self.console_text.insert(tk.END, ''.join(
+                f"[{entry['timestamp']}] {entry['message']}\n" for entry in batch
+            ))
+            
+            # Keep the widget bounded by trimming the oldest lines
+            line_count = int(self.console_text.index('end-1c').split('.')[0]) - 1
+            excess = line_count - self.console_ui_max_lines
+            if excess > 0:
+                self.console_text.delete('1.0', f'{excess + 1}.0')
+            
             self.console_text.see(tk.END)
-        
-        # Save console history
-        self.save_console_history()
+        except Exception as e:
+            print(f"Error updating console: {e}")
 
     def start_web_server(self):
         """Start the web server in a separate thread"""
@@ -1267,7 +2018,10 @@ class MinecraftServerWrapper:
     def _run_web_server(self):
         """Run the web server"""
         try:
-            self.socketio.run(self.web_server, host='0.0.0.0', port=5000, debug=False, use_reloader=False)
+            # Threading mode runs Werkzeug with one thread per request/WebSocket; allow it
+            # explicitly so the server also starts when there is no console (pythonw)
+            self.socketio.run(self.web_server, host='0.0.0.0', port=5000, debug=False,
+                              use_reloader=False, allow_unsafe_werkzeug=True)
         except Exception as e:
             print(f"Web server error: {e}")
 
@@ -1307,11 +2061,23 @@ class MinecraftServerWrapper:
             print(f"Error loading users: {e}")
             self.users = {}
 
+    def write_json_file(self, path, data, indent):
+        """Write JSON to a temp file and swap it in, so a crash never leaves a truncated file"""
+        # A unique temp name per call, so concurrent saves (Tk thread, update worker)
+        # never write into the same file
+        temp_fd, temp_file = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path) or '.')
+        try:
+            with os.fdopen(temp_fd, 'w') as f:
+                json.dump(data, f, indent=indent)
+            os.replace(temp_file, path)
+        except BaseException:
+            os.remove(temp_file)
+            raise
+
     def save_users(self):
         """Save users to file"""
         try:
-            with open(self.users_file, 'w') as f:
-                json.dump(self.users, f, indent=2)
+            self.write_json_file(self.users_file, self.users, 2)
         except Exception as e:
             print(f"Error saving users: {e}")
 
@@ -1330,8 +2096,7 @@ class MinecraftServerWrapper:
     def save_pending_registrations(self):
         """Save pending registrations to file"""
         try:
-            with open(self.pending_registrations_file, 'w') as f:
-                json.dump(self.pending_registrations, f, indent=2)
+            self.write_json_file(self.pending_registrations_file, self.pending_registrations, 2)
         except Exception as e:
             print(f"Error saving pending registrations: {e}")
 
@@ -1920,17 +2685,9 @@ class MinecraftServerWrapper:
         </html>
         '''
 
-    def setup_web_routes(self):
-        """Setup web server routes"""
-        @self.web_server.route('/')
-        @self.require_auth
-        def index():
-            # Get current user info
-            user = self.users.get(session['user_id'])
-            username = session['user_id']
-            is_admin = user.get('role') == 'admin'
-            
-            return render_template_string('''
+    def get_dashboard_template(self):
+        """Return the main dashboard template (Jinja source)"""
+        return '''
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -1938,66 +2695,256 @@ class MinecraftServerWrapper:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>🎮 Minecraft Server Wrapper</title>
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            background: url('/static/minecraft_backg.png') center center fixed;
-            background-size: cover;
-            background-repeat: no-repeat;
-            background-attachment: fixed;
-            color: black;
-            min-height: 100vh;
-            line-height: 1.6;
-            position: relative;
-            transition: all 0.3s ease;
-        }
-        
-        body::before {
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, 
-                rgba(20, 30, 48, 0.9) 0%, 
-                rgba(30, 40, 60, 0.85) 25%, 
-                rgba(40, 50, 70, 0.8) 50%, 
-                rgba(30, 40, 60, 0.85) 75%, 
-                rgba(20, 30, 48, 0.9) 100%);
-            backdrop-filter: blur(8px);
-            z-index: -1;
-            transition: all 0.3s ease;
-        }
-        
-        /* Light mode styles */
-        body.light-mode {
-            color: #333;
-        }
+    <link rel="stylesheet" href="{{ css_url }}">
+</head>
+<body>
+    <!-- Theme Toggle Button -->
+    <button class="theme-toggle">
+        <span id="theme-icon">🌙</span>
+        <span id="theme-text">Dark Mode</span>
+    </button>
+    
+    <div class="container">
+        <!-- Left Sidebar -->
+        <div class="sidebar">
+            <div class="sidebar-card">
+                <h3>📂 File Management</h3>
+                <a href="/files" class="sidebar-btn btn-files">
+                    📁 Open File Manager
+                </a>
+                <div class="sidebar-info">
+                    <p>Manage your Minecraft server files with drag-and-drop functionality. Upload, download, rename, and delete files easily.</p>
+                </div>
+            </div>
+            
+            <div class="sidebar-card">
+                <h3>🔄 System Updates</h3>
+                <button class="sidebar-btn btn-updates">
+                    🔍 Check for Updates
+                </button>
+                <div class="sidebar-info">
+                    <p>Keep your server wrapper up-to-date with the latest features and security improvements.</p>
+                </div>
+            </div>
+            
+            {% if is_admin %}
+            <div class="sidebar-card">
+                <h3>👑 Administration</h3>
+                <a href="/admin" class="sidebar-btn btn-admin-sidebar">
+                    ⚙️ Admin Panel
+                </a>
+                <div class="sidebar-info">
+                    <p>Manage users, configure settings, and access advanced administrative features.</p>
+                </div>
+            </div>
+            {% endif %}
+        </div>
         
-        body.light-mode::before {
-            background: linear-gradient(135deg, 
-                rgba(240, 248, 255, 0.9) 0%, 
-                rgba(230, 240, 250, 0.85) 25%, 
-                rgba(220, 235, 255, 0.8) 50%, 
-                rgba(230, 240, 250, 0.85) 75%, 
-                rgba(240, 248, 255, 0.9) 100%);
-            backdrop-filter: blur(8px);
-        }
+        <!-- Main Content -->
+        <div class="main-content">
+            <div class="header">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <h1>🎮 Minecraft Server Wrapper</h1>
+                        <p>Advanced Server Management Dashboard</p>
+                    </div>
+                    <div style="text-align: right;">
+                        <p style="margin: 0; font-size: 1.1em; font-weight: 500;">Welcome, {{ username }}!</p>
+                        <div style="margin-top: 10px;">
+                            <a href="/logout" class="logout-link">🚪 Logout</a>
+                        </div>
+                    </div>
+                </div>
+            </div>
         
-        /* Theme toggle button */
-        .theme-toggle {
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            z-index: 1000;
-            background: rgba(255, 255, 255, 0.2);
+        <!-- Server Monitor Section -->
+        <div class="monitor-section">
+            
+            <div class="monitor-grid">
+                <div class="card status-card">
+                    <h3>🔧 Server Status</h3>
+                    <div id="status" style="display: flex; align-items: center; margin-bottom: 20px;">
+                        <span class="status-indicator status-stopped"></span>
+                        <span id="status-text" style="font-size: 1.2em; font-weight: 600;">Server Stopped</span>
+                    </div>
+                    <div class="status-details">
+                        <div class="status-item">
+                            <span class="status-label">👥 Players:</span>
+                            <span class="status-value"><span id="player-count">0</span>/<span id="max-players">20</span></span>
+                        </div>
+                        <div class="status-item">
+                            <span class="status-label">⏱️ Uptime:</span>
+                            <span class="status-value" id="uptime">0 minutes</span>
+                        </div>
+                        <div class="status-item">
+                            <span class="status-label">🌐 Server IP:</span>
+                            <span class="status-value">localhost:25565</span>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="card">
+                    <h3>⚡ Server Controls</h3>
+                    <div class="control-buttons">
+                        <button class="btn btn-start">▶ Start Server</button>
+                        <button class="btn btn-stop">⏹ Stop Server</button>
+                        <button class="btn btn-restart">🔄 Restart</button>
+                        <button class="btn btn-optimize">🧹 Clean RAM</button>
+                    </div>
+                </div>
+                
+                <div class="card performance-card">
+                    <h3>📊 Performance Metrics</h3>
+                    <div class="performance-grid">
+                        <div class="metric-item">
+                            <div class="metric-header">
+                                <span class="metric-icon">🖥️</span>
+                                <div class="metric-info">
+                                    <div class="metric-label">CPU Usage</div>
+                                    <div class="metric-value"><span id="cpu-usage">0</span>%</div>
+                                </div>
+                            </div>
+                            <div class="metric-bar">
+                                <div class="metric-fill" id="cpu-bar" style="background: linear-gradient(90deg, #27ae60, #f39c12, #e74c3c);"></div>
+                            </div>
+                        </div>
+                        
+                        <div class="metric-item">
+                            <div class="metric-header">
+                                <span class="metric-icon">💾</span>
+                                <div class="metric-info">
+                                    <div class="metric-label">System RAM</div>
+                                    <div class="metric-value"><span id="ram-usage">0</span>%</div>
+                                </div>
+                            </div>
+                            <div class="metric-bar">
+                                <div class="metric-fill" id="ram-bar" style="background: linear-gradient(90deg, #3498db, #9b59b6);"></div>
+                            </div>
+                        </div>
+                        
+                        <div class="metric-item">
+                            <div class="metric-header">
+                                <span class="metric-icon">🎮</span>
+                                <div class="metric-info">
+                                    <div class="metric-label">Server RAM</div>
+                                    <div class="metric-value"><span id="server-ram">0</span> MB</div>
+                                </div>
+                            </div>
+                            <div class="metric-bar">
+                                <div class="metric-fill" id="server-ram-bar" style="background: linear-gradient(90deg, #e67e22, #d35400);"></div>
+                            </div>
+                        </div>
+                        
+                        <div class="metric-item">
+                            <div class="metric-header">
+                                <span class="metric-icon">⚡</span>
+                                <div class="metric-info">
+                                    <div class="metric-label">Server TPS</div>
+                                    <div class="metric-value" id="server-tps">20.0</div>
+                                </div>
+                            </div>
+                            <div class="metric-bar">
+                                <div class="metric-fill" id="tps-bar" style="transform: scaleX(1); background: linear-gradient(90deg, #e74c3c, #f39c12, #27ae60);"></div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+        
+        <!-- Management Section -->
+        <div class="management-section">
+            
+            <div class="dashboard-grid">
+                <div class="card console-section">
+                    <h3>📟 Real-time Console</h3>
+                    <div id="console" class="console"></div>
+                    <div class="command-input">
+                        <input type="text" id="command" placeholder="Enter server command...">
+                        <button id="send-command">Send</button>
+                    </div>
+                </div>
+            </div>
+        </div>
+        </div> <!-- End main-content -->
+    </div> <!-- End container -->
+    
+    <div id="notification" class="notification"></div>
+    
+    <template id="log-tpl"><div class="console-line"><span class="console-timestamp"></span> <span class="console-msg"></span></div></template>
+    
+    {% if use_msgpack %}
+    <script src="https://cdn.socket.io/4.7.2/socket.io.msgpack.min.js"></script>
+    {% else %}
+    <script src="https://cdn.socket.io/4.7.2/socket.io.min.js"></script>
+    {% endif %}
+    <script src="{{ js_url }}"></script>
+</body>
+</html>
+        '''
+
+    def get_dashboard_css(self):
+        """Return the dashboard stylesheet (served as a cached static asset)"""
+        return '''
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
+            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+            background: url('/static/minecraft_backg.png') center center fixed;
+            background-size: cover;
+            background-repeat: no-repeat;
+            background-attachment: fixed;
+            color: black;
+            min-height: 100vh;
+            line-height: 1.6;
+            position: relative;
+            transition: all 0.3s ease;
+        }
+        
+        body::before {
+            content: '';
+            position: fixed;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: linear-gradient(135deg, 
+                rgba(20, 30, 48, 0.9) 0%, 
+                rgba(30, 40, 60, 0.85) 25%, 
+                rgba(40, 50, 70, 0.8) 50%, 
+                rgba(30, 40, 60, 0.85) 75%, 
+                rgba(20, 30, 48, 0.9) 100%);
+            backdrop-filter: blur(8px);
+            z-index: -1;
+            transition: all 0.3s ease;
+        }
+        
+        /* Light mode styles */
+        body.light-mode {
+            color: #333;
+        }
+        
+        body.light-mode::before {
+            background: linear-gradient(135deg, 
+                rgba(240, 248, 255, 0.9) 0%, 
+                rgba(230, 240, 250, 0.85) 25%, 
+                rgba(220, 235, 255, 0.8) 50%, 
+                rgba(230, 240, 250, 0.85) 75%, 
+                rgba(240, 248, 255, 0.9) 100%);
+            backdrop-filter: blur(8px);
+        }
+        
+        /* Theme toggle button */
+        .theme-toggle {
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            z-index: 1000;
+            background: rgba(255, 255, 255, 0.2);
             border: 1px solid rgba(255, 255, 255, 0.3);
             border-radius: 50px;
             padding: 12px 20px;
@@ -2168,6 +3115,19 @@ class MinecraftServerWrapper:
             border: 1px solid rgba(255, 255, 255, 0.9);
         }
         
+        .logout-link {
+            color: white;
+            text-decoration: none;
+            background: rgba(255,255,255,0.2);
+            padding: 8px 16px;
+            border-radius: 5px;
+            transition: background 0.3s;
+        }
+        
+        .logout-link:hover {
+            background: rgba(255,255,255,0.3);
+        }
+        
         .header h1 {
             font-size: 2.5em;
             font-weight: 700;
@@ -2372,9 +3332,13 @@ class MinecraftServerWrapper:
         }
         
         .metric-fill {
+            width: 100%;
             height: 100%;
             border-radius: 4px;
-            transition: width 0.5s ease;
+            /* Animate with transform so bar updates stay on the compositor */
+            transform-origin: left;
+            transform: scaleX(0);
+            transition: transform 0.5s ease;
         }
         
         .btn {
@@ -2497,10 +3461,9 @@ class MinecraftServerWrapper:
             color: white;
             font-weight: 600;
             transform: translateX(400px);
-            transition: all 0.3s ease;
+            transition: transform 0.3s ease, opacity 0.3s ease;
             z-index: 1000;
             box-shadow: 0 8px 25px rgba(0,0,0,0.3);
-            backdrop-filter: blur(10px);
         }
         
         .notification.show {
@@ -2525,246 +3488,74 @@ class MinecraftServerWrapper:
                 gap: 15px;
             }
             
-            .sidebar {
-                width: 100%;
-                order: -1;
-            }
-            
-            .sidebar-card {
-                padding: 20px;
-            }
-            
-            .sidebar-btn {
-                padding: 12px 16px;
-                font-size: 13px;
-            }
-            
-            .dashboard-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .monitor-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .performance-card {
-                grid-column: span 1;
-            }
-            
-            .performance-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .control-buttons, .tool-buttons {
-                flex-direction: column;
-            }
-            
-            .btn {
-                width: 100%;
-            }
-            
-            .header h1 {
-                font-size: 2em;
-            }
-            
-            .console {
-                height: 300px;
-            }
-            
-            .command-input {
-                flex-direction: column;
-            }
-            
-            .metric-header {
-                flex-direction: column;
-                text-align: center;
-                gap: 8px;
-            }
-            
-            .metric-icon {
-                margin: 0 auto;
-            }
-        }
-    </style>
-</head>
-<body>
-    <!-- Theme Toggle Button -->
-    <button class="theme-toggle" onclick="toggleTheme()">
-        <span id="theme-icon">🌙</span>
-        <span id="theme-text">Dark Mode</span>
-    </button>
-    
-    <div class="container">
-        <!-- Left Sidebar -->
-        <div class="sidebar">
-            <div class="sidebar-card">
-                <h3>📂 File Management</h3>
-                <a href="/files" class="sidebar-btn btn-files">
-                    📁 Open File Manager
-                </a>
-                <div class="sidebar-info">
-                    <p>Manage your Minecraft server files with drag-and-drop functionality. Upload, download, rename, and delete files easily.</p>
-                </div>
-            </div>
-            
-            <div class="sidebar-card">
-                <h3>🔄 System Updates</h3>
-                <button class="sidebar-btn btn-updates" onclick="checkForUpdates()">
-                    🔍 Check for Updates
-                </button>
-                <div class="sidebar-info">
-                    <p>Keep your server wrapper up-to-date with the latest features and security improvements.</p>
-                </div>
-            </div>
-            
-            {% if is_admin %}
-            <div class="sidebar-card">
-                <h3>👑 Administration</h3>
-                <a href="/admin" class="sidebar-btn btn-admin-sidebar">
-                    ⚙️ Admin Panel
-                </a>
-                <div class="sidebar-info">
-                    <p>Manage users, configure settings, and access advanced administrative features.</p>
-                </div>
-            </div>
-            {% endif %}
-        </div>
-        
-        <!-- Main Content -->
-        <div class="main-content">
-            <div class="header">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <h1>🎮 Minecraft Server Wrapper</h1>
-                        <p>Advanced Server Management Dashboard</p>
-                    </div>
-                    <div style="text-align: right;">
-                        <p style="margin: 0; font-size: 1.1em; font-weight: 500;">Welcome, {{ username }}!</p>
-                        <div style="margin-top: 10px;">
-                            <a href="/logout" style="color: white; text-decoration: none; background: rgba(255,255,255,0.2); padding: 8px 16px; border-radius: 5px; transition: background 0.3s;" onmouseover="this.style.background='rgba(255,255,255,0.3)'" onmouseout="this.style.background='rgba(255,255,255,0.2)'">🚪 Logout</a>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        
-        <!-- Server Monitor Section -->
-        <div class="monitor-section">
-            
-            <div class="monitor-grid">
-                <div class="card status-card">
-                    <h3>🔧 Server Status</h3>
-                    <div id="status" style="display: flex; align-items: center; margin-bottom: 20px;">
-                        <span class="status-indicator status-stopped"></span>
-                        <span id="status-text" style="font-size: 1.2em; font-weight: 600;">Server Stopped</span>
-                    </div>
-                    <div class="status-details">
-                        <div class="status-item">
-                            <span class="status-label">👥 Players:</span>
-                            <span class="status-value"><span id="player-count">0</span>/<span id="max-players">20</span></span>
-                        </div>
-                        <div class="status-item">
-                            <span class="status-label">⏱️ Uptime:</span>
-                            <span class="status-value" id="uptime">0 minutes</span>
-                        </div>
-                        <div class="status-item">
-                            <span class="status-label">🌐 Server IP:</span>
-                            <span class="status-value">localhost:25565</span>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="card">
-                    <h3>⚡ Server Controls</h3>
-                    <div class="control-buttons">
-                        <button class="btn btn-start" onclick="startServer()">▶ Start Server</button>
-                        <button class="btn btn-stop" onclick="stopServer()">⏹ Stop Server</button>
-                        <button class="btn btn-restart" onclick="restartServer()">🔄 Restart</button>
-                        <button class="btn btn-optimize" onclick="optimizeRAM()">🧹 Clean RAM</button>
-                    </div>
-                </div>
-                
-                <div class="card performance-card">
-                    <h3>📊 Performance Metrics</h3>
-                    <div class="performance-grid">
-                        <div class="metric-item">
-                            <div class="metric-header">
-                                <span class="metric-icon">🖥️</span>
-                                <div class="metric-info">
-                                    <div class="metric-label">CPU Usage</div>
-                                    <div class="metric-value" id="cpu-usage">0%</div>
-                                </div>
-                            </div>
-                            <div class="metric-bar">
-                                <div class="metric-fill" id="cpu-bar" style="width: 0%; background: linear-gradient(90deg, #27ae60, #f39c12, #e74c3c);"></div>
-                            </div>
-                        </div>
-                        
-                        <div class="metric-item">
-                            <div class="metric-header">
-                                <span class="metric-icon">💾</span>
-                                <div class="metric-info">
-                                    <div class="metric-label">System RAM</div>
-                                    <div class="metric-value" id="ram-usage">0%</div>
-                                </div>
-                            </div>
-                            <div class="metric-bar">
-                                <div class="metric-fill" id="ram-bar" style="width: 0%; background: linear-gradient(90deg, #3498db, #9b59b6);"></div>
-                            </div>
-                        </div>
-                        
-                        <div class="metric-item">
-                            <div class="metric-header">
-                                <span class="metric-icon">🎮</span>
-                                <div class="metric-info">
-                                    <div class="metric-label">Server RAM</div>
-                                    <div class="metric-value" id="server-ram">0 MB</div>
-                                </div>
-                            </div>
-                            <div class="metric-bar">
-                                <div class="metric-fill" id="server-ram-bar" style="width: 0%; background: linear-gradient(90deg, #e67e22, #d35400);"></div>
-                            </div>
-                        </div>
-                        
-                        <div class="metric-item">
-                            <div class="metric-header">
-                                <span class="metric-icon">⚡</span>
-                                <div class="metric-info">
-                                    <div class="metric-label">Server TPS</div>
-                                    <div class="metric-value" id="server-tps">20.0</div>
-                                </div>
-                            </div>
-                            <div class="metric-bar">
-                                <div class="metric-fill" id="tps-bar" style="width: 100%; background: linear-gradient(90deg, #e74c3c, #f39c12, #27ae60);"></div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Management Section -->
-        <div class="management-section">
+            .sidebar {
+                width: 100%;
+                order: -1;
+            }
             
-            <div class="dashboard-grid">
-                <div class="card console-section">
-                    <h3>📟 Real-time Console</h3>
-                    <div id="console" class="console"></div>
-                    <div class="command-input">
-                        <input type="text" id="command" placeholder="Enter server command..." onkeypress="if(event.key==='Enter') sendCommand()">
-                        <button onclick="sendCommand()">Send</button>
-                    </div>
-                </div>
-            </div>
-        </div>
-        </div> <!-- End main-content -->
-    </div> <!-- End container -->
-    
-    <div id="notification" class="notification"></div>
-    
-    <script src="https://cdn.socket.io/4.7.2/socket.io.min.js"></script>
-    <script>
+            .sidebar-card {
+                padding: 20px;
+            }
+            
+            .sidebar-btn {
+                padding: 12px 16px;
+                font-size: 13px;
+            }
+            
+            .dashboard-grid {
+                grid-template-columns: 1fr;
+            }
+            
+            .monitor-grid {
+                grid-template-columns: 1fr;
+            }
+            
+            .performance-card {
+                grid-column: span 1;
+            }
+            
+            .performance-grid {
+                grid-template-columns: 1fr;
+            }
+            
+            .control-buttons, .tool-buttons {
+                flex-direction: column;
+            }
+            
+            .btn {
+                width: 100%;
+            }
+            
+            .header h1 {
+                font-size: 2em;
+            }
+            
+            .console {
+                height: 300px;
+            }
+            
+            .command-input {
+                flex-direction: column;
+            }
+            
+            .metric-header {
+                flex-direction: column;
+                text-align: center;
+                gap: 8px;
+            }
+            
+            .metric-icon {
+                margin: 0 auto;
+            }
+        }
+        '''
+
+    def get_dashboard_js(self):
+        """Return the dashboard script (served as a cached static asset)"""
+        return '''
         // Initialize Socket.IO for real-time updates
-        const socket = io();
+        // Browsers with DecompressionStream get the connect-time history deflated
+        const socket = io({ auth: { inflate: 'DecompressionStream' in window } });
         
         // Theme management
         function toggleTheme() {
@@ -2821,85 +3612,195 @@ class MinecraftServerWrapper:
             showNotification('Disconnected from server', 'error');
         });
         
-        socket.on('performance_update', function(data) {
-            updatePerformanceMetrics(data);
+        // The server sends a full keyframe, then only changed fields. Merge
+        // them into one state object and render it once per animation frame
+        const metricsState = {};
+        let metricsReady = false;
+        let metricsFlushPending = false;
+        
+        function handlePerformanceUpdate(data) {
+            Object.assign(metricsState, data);
+            if (data.keyframe) {
+                metricsReady = true;
+            }
+            if (metricsReady && !metricsFlushPending) {
+                metricsFlushPending = true;
+                requestAnimationFrame(flushMetrics);
+            }
+        }
+        
+        socket.on('performance_update', handlePerformanceUpdate);
+        
+        // Metrics and console lines that were ready together arrive as one frame
+        socket.on('dashboard_tick', function(tick) {
+            handlePerformanceUpdate(tick.perf);
+            tick.console.forEach(queueConsoleLine);
         });
         
-        socket.on('console_update', function(data) {
-            updateConsoleRealtime(data);
+        function flushMetrics() {
+            metricsFlushPending = false;
+            updatePerformanceMetrics(metricsState);
+        }
+        
+        socket.on('console_update_batch', function(entries) {
+            entries.forEach(queueConsoleLine);
         });
         
         socket.on('console_history', function(logs) {
             loadConsoleHistory(logs);
         });
         
+        socket.on('console_history_z', function(buf) {
+            const stream = new Blob([buf]).stream().pipeThrough(new DecompressionStream('deflate'));
+            new Response(stream).text()
+                .then(text => loadConsoleHistory(JSON.parse(text)))
+                .catch(error => console.log('Could not load console history'));
+        });
+        
+        socket.on('status_change', function(status) {
+            DOM.statusIndicator.className = 'status-indicator ' + (status.running ? 'status-running' : 'status-stopped');
+            DOM.statusText.textContent = status.running ? 'Server Running' : 'Server Stopped';
+        });
+        
         socket.on('ram_optimized', function(data) {
-            showNotification(data.message, 'success');
+            if (data.error) {
+                showNotification(data.error, 'error');
+            } else {
+                showNotification(data.message, 'success');
+            }
         });
         
+        // Metric elements are looked up once; lastRendered remembers what is on
+        // screen so unchanged fields skip the DOM write entirely
+        const DOM = {
+            cpuUsage: document.getElementById('cpu-usage'),
+            cpuBar: document.getElementById('cpu-bar'),
+            ramUsage: document.getElementById('ram-usage'),
+            ramBar: document.getElementById('ram-bar'),
+            serverRam: document.getElementById('server-ram'),
+            serverRamBar: document.getElementById('server-ram-bar'),
+            serverTps: document.getElementById('server-tps'),
+            tpsBar: document.getElementById('tps-bar'),
+            playerCount: document.getElementById('player-count'),
+            maxPlayers: document.getElementById('max-players'),
+            uptime: document.getElementById('uptime'),
+            statusIndicator: document.querySelector('.status-indicator'),
+            statusText: document.getElementById('status-text')
+        };
+        
+        const lastRendered = {
+            cpu: NaN, ram: NaN, srvRam: NaN, tps: NaN,
+            players: -1, max: -1, uptime: -1
+        };
+        
         function updatePerformanceMetrics(data) {
             // Update CPU
-            document.getElementById('cpu-usage').textContent = `${data.cpu_usage.toFixed(1)}%`;
-            document.getElementById('cpu-bar').style.width = `${data.cpu_usage}%`;
+            const cpu = +data.cpu_usage.toFixed(1);
+            if (cpu !== lastRendered.cpu) {
+                DOM.cpuUsage.textContent = cpu.toFixed(1);
+                DOM.cpuBar.style.transform = `scaleX(${cpu / 100})`;
+                lastRendered.cpu = cpu;
+            }
             
             // Update System RAM
-            document.getElementById('ram-usage').textContent = `${data.ram_usage.toFixed(1)}%`;
-            document.getElementById('ram-bar').style.width = `${data.ram_usage}%`;
+            const ram = +data.ram_usage.toFixed(1);
+            if (ram !== lastRendered.ram) {
+                DOM.ramUsage.textContent = ram.toFixed(1);
+                DOM.ramBar.style.transform = `scaleX(${ram / 100})`;
+                lastRendered.ram = ram;
+            }
             
             // Update Server RAM
-            document.getElementById('server-ram').textContent = `${data.server_ram_usage.toFixed(1)} MB`;
-            const serverRamPercent = Math.min((data.server_ram_usage / 2048) * 100, 100);
-            document.getElementById('server-ram-bar').style.width = `${serverRamPercent}%`;
+            const srvRam = +data.server_ram_usage.toFixed(1);
+            if (srvRam !== lastRendered.srvRam) {
+                DOM.serverRam.textContent = srvRam.toFixed(1);
+                const serverRamFraction = Math.min(srvRam / 2048, 1);
+                DOM.serverRamBar.style.transform = `scaleX(${serverRamFraction})`;
+                lastRendered.srvRam = srvRam;
+            }
             
-            // Update TPS
-            document.getElementById('server-tps').textContent = data.server_tps.toFixed(1);
-            const tpsPercent = (data.server_tps / 20) * 100;
-            document.getElementById('tps-bar').style.width = `${tpsPercent}%`;
+            // Update TPS (null: the server can't report it, e.g. vanilla)
+            const tps = data.server_tps === null ? null : +data.server_tps.toFixed(1);
+            if (tps !== lastRendered.tps) {
+                DOM.serverTps.textContent = tps === null ? 'N/A' : tps.toFixed(1);
+                DOM.tpsBar.style.transform = `scaleX(${(tps || 0) / 20})`;
+                lastRendered.tps = tps;
+            }
             
             // Update player count
-            document.getElementById('player-count').textContent = data.player_count;
-            document.getElementById('max-players').textContent = data.max_players;
-            
-            // Update uptime
-            const uptime = data.uptime;
-            const uptimeText = uptime >= 60 ? `${Math.floor(uptime/60)}h ${uptime%60}m` : `${uptime}m`;
-            document.getElementById('uptime').textContent = uptimeText;
-            
-            // Update status
-            const statusIndicator = document.querySelector('.status-indicator');
-            const statusText = document.getElementById('status-text');
-            if (data.server_running) {
-                statusIndicator.className = 'status-indicator status-running';
-                statusText.textContent = 'Server Running';
-            } else {
-                statusIndicator.className = 'status-indicator status-stopped';
-                statusText.textContent = 'Server Stopped';
+            if (data.player_count !== lastRendered.players) {
+                DOM.playerCount.textContent = data.player_count;
+                lastRendered.players = data.player_count;
+            }
+            if (data.max_players !== lastRendered.max) {
+                DOM.maxPlayers.textContent = data.max_players;
+                lastRendered.max = data.max_players;
+            }
+            
+            // Update uptime (formatted on the server)
+            if (data.uptime !== lastRendered.uptime) {
+                DOM.uptime.textContent = data.uptime_str;
+                lastRendered.uptime = data.uptime;
+            }
+        }
+        
+        // Console lines arriving within the same frame are appended together so
+        // layout and the scroll-to-bottom happen once per frame, not per line
+        const consoleEl = document.getElementById('console');
+        const logTpl = document.getElementById('log-tpl').content.firstElementChild;
+        const logQueue = [];
+        let logFlushPending = false;
+        const MAX_CONSOLE_LINES = 2000;
+        
+        function queueConsoleLine(data) {
+            if (!data.message) return;
+            logQueue.push(data);
+            if (!logFlushPending) {
+                logFlushPending = true;
+                requestAnimationFrame(flushLogs);
             }
         }
         
-        function updateConsoleRealtime(data) {
-            const console = document.getElementById('console');
-            if (data.message) {
-                const logEntry = document.createElement('div');
-                logEntry.className = 'console-line';
-                logEntry.innerHTML = `<span class="console-timestamp">[${data.timestamp}]</span> ${data.message}`;
-                console.appendChild(logEntry);
-                console.scrollTop = console.scrollHeight;
+        // Clone the prebuilt line and fill it via textContent: no HTML parsing,
+        // and server log text can never be interpreted as markup
+        function buildLogLine(data) {
+            const node = logTpl.cloneNode(true);
+            node.firstChild.textContent = '[' + data.timestamp + ']';
+            node.lastChild.textContent = data.message;
+            return node;
+        }
+        
+        function flushLogs() {
+            const frag = document.createDocumentFragment();
+            for (const data of logQueue) {
+                frag.appendChild(buildLogLine(data));
             }
+            logQueue.length = 0;
+            logFlushPending = false;
+            consoleEl.appendChild(frag);
+            trimConsole();
+            consoleEl.scrollTop = consoleEl.scrollHeight;
+        }
+        
+        // Keep the console bounded: drop the oldest lines in one range delete
+        function trimConsole() {
+            const overflow = consoleEl.childElementCount - MAX_CONSOLE_LINES;
+            if (overflow <= 0) return;
+            const range = document.createRange();
+            range.setStartBefore(consoleEl.firstElementChild);
+            range.setEndAfter(consoleEl.children[overflow - 1]);
+            range.deleteContents();
         }
         
         function loadConsoleHistory(logs) {
-            const console = document.getElementById('console');
-            console.innerHTML = ''; // Clear existing content
-            
+            const frag = document.createDocumentFragment();
             logs.forEach(log => {
-                const logEntry = document.createElement('div');
-                logEntry.className = 'console-line';
-                logEntry.innerHTML = `<span class="console-timestamp">[${log.timestamp}]</span> ${log.message}`;
-                console.appendChild(logEntry);
+                frag.appendChild(buildLogLine(log));
             });
             
-            console.scrollTop = console.scrollHeight;
+            consoleEl.innerHTML = ''; // Clear existing content
+            consoleEl.appendChild(frag);
+            consoleEl.scrollTop = consoleEl.scrollHeight;
         }
         
         function showNotification(message, type = 'success') {
@@ -2912,33 +3813,39 @@ class MinecraftServerWrapper:
             }, 4000);
         }
         
-        function startServer() {
-            fetch('/api/start', {method: 'POST'})
-                .then(response => response.json())
-                .then(data => showNotification(data.message || data.error, data.error ? 'error' : 'success'))
-                .catch(error => showNotification('Error starting server', 'error'));
+        // Server controls ride the open Socket.IO connection and are answered
+        // through the ack callback instead of a separate HTTP request each
+        function sendControl(action, payload, errorMessage, onSuccess) {
+            socket.timeout(60000).emit('control', action, payload, (err, data) => {
+                if (err) {
+                    showNotification(errorMessage, 'error');
+                } else if (data.error) {
+                    showNotification(data.error, 'error');
+                } else if (onSuccess) {
+                    onSuccess(data);
+                } else {
+                    showNotification(data.message, 'success');
+                }
+            });
         }
         
-        function stopServer() {
-            fetch('/api/stop', {method: 'POST'})
-                .then(response => response.json())
-                .then(data => showNotification(data.message || data.error, data.error ? 'error' : 'success'))
-                .catch(error => showNotification('Error stopping server', 'error'));
-        }
+        // Collapse rapid repeat clicks into a single call
+        const throttle = (fn, ms) => {
+            let last = 0;
+            return (...args) => {
+                const now = performance.now();
+                if (now - last < ms) return;
+                last = now;
+                fn(...args);
+            };
+        };
         
-        function restartServer() {
-            fetch('/api/restart', {method: 'POST'})
-                .then(response => response.json())
-                .then(data => showNotification(data.message || data.error, data.error ? 'error' : 'success'))
-                .catch(error => showNotification('Error restarting server', 'error'));
-        }
+        const startServer = throttle(() => sendControl('start', null, 'Error starting server'), 500);
+        const stopServer = throttle(() => sendControl('stop', null, 'Error stopping server'), 500);
+        const restartServer = throttle(() => sendControl('restart', null, 'Error restarting server'), 500);
+        const optimizeRAM = throttle(() => sendControl('optimize-ram', null, 'Error optimizing RAM'), 500);
         
-        function optimizeRAM() {
-            fetch('/api/optimize-ram', {method: 'POST'})
-                .then(response => response.json())
-                .then(data => showNotification(data.message || data.error, data.error ? 'error' : 'success'))
-                .catch(error => showNotification('Error optimizing RAM', 'error'));
-        }
+        let lastCommandSent = 0;
         
         function sendCommand() {
             const commandInput = document.getElementById('command');
@@ -2946,20 +3853,14 @@ class MinecraftServerWrapper:
             
             if (!command) return;
             
-            fetch('/api/command', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({command: command})
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.error) {
-                    showNotification(data.error, 'error');
-                } else {
-                    commandInput.value = '';
-                }
-            })
-            .catch(error => showNotification('Error sending command', 'error'));
+            // Swallow key-repeat Enter presses
+            const now = performance.now();
+            if (now - lastCommandSent < 50) return;
+            lastCommandSent = now;
+            
+            sendControl('command', {command: command}, 'Error sending command', () => {
+                commandInput.value = '';
+            });
         }
         
         function checkForUpdates() {
@@ -2998,6 +3899,19 @@ class MinecraftServerWrapper:
                 .catch(error => showNotification('Error applying update', 'error'));
         }
         
+        // Wire up controls (no inline on* attributes in the markup)
+        const passive = {passive: true};
+        document.querySelector('.theme-toggle').addEventListener('click', toggleTheme, passive);
+        document.querySelector('.btn-updates').addEventListener('click', checkForUpdates, passive);
+        document.querySelector('.btn-start').addEventListener('click', startServer, passive);
+        document.querySelector('.btn-stop').addEventListener('click', stopServer, passive);
+        document.querySelector('.btn-restart').addEventListener('click', restartServer, passive);
+        document.querySelector('.btn-optimize').addEventListener('click', optimizeRAM, passive);
+        document.getElementById('send-command').addEventListener('click', sendCommand, passive);
+        document.getElementById('command').addEventListener('keydown', e => {
+            if (e.key === 'Enter') sendCommand();
+        }, passive);
+        
         // Socket event listeners for update notifications
         socket.on('update_available', function(data) {
             showNotification(`Update available! v${data.current_version} → v${data.latest_version}`, 'info');
@@ -3016,25 +3930,16 @@ class MinecraftServerWrapper:
             }
         });
         
-        // Check version on page load
-        fetch('/api/version')
-            .then(response => response.json())
-            .then(data => {
-                if (data.update_available) {
-                    showNotification(`Update available! v${data.current_version} → v${data.latest_version}`, 'info');
-                }
-            })
-            .catch(error => console.log('Could not check version'));
-        
-        // Load console history on page load (fallback if Socket.IO doesn't work)
+        // Version and console history are pushed on connect ('update_available',
+        // 'console_history'); only poll the REST API if Socket.IO never connected
         setTimeout(() => {
+            if (socket.connected) return;
             fetch('/api/console')
                 .then(response => response.json())
                 .then(data => {
                     if (data.logs && data.logs.length > 0) {
                         // Only load if console is empty (Socket.IO didn't work)
-                        const console = document.getElementById('console');
-                        if (console.children.length === 0) {
+                        if (consoleEl.children.length === 0) {
                             loadConsoleHistory(data.logs);
                         }
                     }
@@ -3043,22 +3948,11 @@ class MinecraftServerWrapper:
         }, 1000); // Wait 1 second for Socket.IO to connect first
         
 
-    </script>
-</body>
-</html>
-            ''')
-        
-        @self.web_server.route('/files')
-        def file_manager():
-            return render_template_string('''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>📁 File Manager - Minecraft Server Wrapper</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
+        '''
+
+    def get_file_manager_css(self):
+        """Return the file manager stylesheet (served as a cached static asset)"""
+        return '''
         * {
             margin: 0;
             padding: 0;
@@ -3297,6 +4191,7 @@ class MinecraftServerWrapper:
         }
         
         .file-list {
+            position: relative;
             background: rgba(0, 0, 0, 0.2);
             border-radius: 10px;
             padding: 20px;
@@ -3304,6 +4199,25 @@ class MinecraftServerWrapper:
             overflow-y: auto;
         }
         
+        /* Virtual list: the spacer has the full height, the window holds visible rows */
+        .file-rows {
+            position: relative;
+        }
+        
+        .file-rows-window {
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            will-change: transform;
+        }
+        
+        .file-list-status {
+            text-align: center;
+            opacity: 0.7;
+            padding: 20px;
+        }
+        
         .breadcrumb-nav {
             display: flex;
             align-items: center;
@@ -3348,6 +4262,11 @@ class MinecraftServerWrapper:
             transition: all 0.3s ease;
         }
         
+        .file-item.is-directory .file-icon,
+        .file-item.is-directory .file-info {
+            cursor: pointer;
+        }
+        
         .file-item:hover {
             background: rgba(255, 255, 255, 0.2);
             transform: translateX(5px);
@@ -3361,11 +4280,15 @@ class MinecraftServerWrapper:
         
         .file-info {
             flex: 1;
+            min-width: 0;
         }
         
         .file-name {
             font-weight: 600;
             margin-bottom: 4px;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
         }
         
         .file-details {
@@ -3643,99 +4566,25 @@ class MinecraftServerWrapper:
             .action-btn {
                 padding: 6px 10px;
                 font-size: 0.8rem;
-            }
-            
-            .drop-zone {
-                padding: 30px 15px;
-            }
-            
-            .drop-zone-text {
-                font-size: 1.1rem;
-            }
-            
-            .drop-zone-subtext {
-                font-size: 0.9rem;
-            }
-        }
-    </style>
-</head>
-<body>
-    <!-- Theme Toggle Button -->
-    <button class="theme-toggle" onclick="toggleTheme()">
-        <span id="theme-icon">🌙</span>
-        <span id="theme-text">Dark Mode</span>
-    </button>
-    
-    <div class="container">
-        <div class="header">
-            <div class="header-content">
-                <div>
-                    <h1>📁 File Manager</h1>
-                    <p>Manage your Minecraft server files with drag-and-drop functionality</p>
-                </div>
-                <div class="nav-buttons">
-                    <a href="/" class="nav-btn">🏠 Dashboard</a>
-                    <a href="/admin" class="nav-btn">👑 Admin Panel</a>
-                    <button class="nav-btn" onclick="refreshFileList()">🔄 Refresh</button>
-                </div>
-            </div>
-        </div>
-        
-        <div class="file-manager">
-            <div class="file-controls">
-                <input type="file" id="fileInput" multiple>
-                <button class="btn btn-primary" onclick="document.getElementById('fileInput').click()">
-                    📤 Select Files
-                </button>
-                <button class="btn btn-success" onclick="refreshFileList()">
-                    🔄 Refresh List
-                </button>
-            </div>
-            
-            <div class="drop-zone" id="dropZone">
-                <div class="drop-zone-text">
-                    🎯 Drag and drop files here
-                </div>
-                <div class="drop-zone-subtext">
-                    Or click "Select Files" to browse
-                </div>
-            </div>
-            
-            <div class="upload-progress" id="uploadProgress">
-                <div>Uploading files...</div>
-                <div class="progress-bar">
-                    <div class="progress-fill" id="progressFill"></div>
-                </div>
-            </div>
-            
-            <div class="file-list" id="fileList">
-                <div style="text-align: center; opacity: 0.7; padding: 20px;">
-                    Loading files...
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="notification" id="notification"></div>
-    
-    <!-- File Viewer/Editor Modal -->
-    <div class="modal" id="fileModal">
-        <div class="modal-content">
-            <div class="modal-header">
-                <h3 id="modalTitle">View File</h3>
-                <button class="modal-close" onclick="closeFileModal()">&times;</button>
-            </div>
-            <div class="modal-body">
-                <div class="file-editor-controls" id="editorControls" style="display: none;">
-                    <button class="btn btn-success" onclick="saveFile()">💾 Save</button>
-                    <button class="btn btn-primary" onclick="toggleViewMode()">👁️ View Mode</button>
-                </div>
-                <textarea id="fileContent" readonly></textarea>
-            </div>
-        </div>
-    </div>
-    
-    <script>
+            }
+            
+            .drop-zone {
+                padding: 30px 15px;
+            }
+            
+            .drop-zone-text {
+                font-size: 1.1rem;
+            }
+            
+            .drop-zone-subtext {
+                font-size: 0.9rem;
+            }
+        }
+        '''
+
+    def get_file_manager_js(self):
+        """Return the file manager script (served as a cached static asset)"""
+        return '''
         // File input change handler
         document.getElementById('fileInput').addEventListener('change', function(e) {
             if (e.target.files.length > 0) {
@@ -3789,75 +4638,253 @@ class MinecraftServerWrapper:
         // Current path tracking
         let currentPath = '';
         
+        // Listings arrive in pages; more are requested as the list scrolls near the end
+        const FILE_PAGE_SIZE = 200;
+        let fileListRequest = 0;  // bumped per navigation so late pages are dropped
+        let filesTotal = 0;
+        let filePageLoading = false;
+        
+        function fetchFilePage(path, offset) {
+            const params = new URLSearchParams({ offset, limit: FILE_PAGE_SIZE });
+            if (path) params.set('path', path);
+            return fetch(`/api/files?${params}`).then(response => response.json());
+        }
+        
         function refreshFileList(path = currentPath) {
             currentPath = path;
-            const url = path ? `/api/files?path=${encodeURIComponent(path)}` : '/api/files';
+            const request = ++fileListRequest;
+            filePageLoading = true;
             
-            fetch(url)
-                .then(response => response.json())
+            fetchFilePage(path, 0)
                 .then(data => {
+                    if (request !== fileListRequest) return;
+                    filePageLoading = false;
                     if (data.error) {
                         showNotification(data.error, 'error');
                         return;
                     }
+                    filesTotal = data.total;
                     displayFiles(data.files, data.breadcrumbs || [], data.relative_path || '');
                 })
                 .catch(error => {
+                    if (request !== fileListRequest) return;
+                    filePageLoading = false;
                     console.error('Error fetching files:', error);
                     showNotification('Failed to load files', 'error');
                 });
         }
         
-        function displayFiles(files, breadcrumbs, relativePath) {
-            const fileList = document.getElementById('fileList');
-            
-            // Create breadcrumb navigation
-            let breadcrumbHtml = `
-                <div class="breadcrumb-nav">
-                    <button class="breadcrumb-item" onclick="navigateToPath('')">🏠 Home</button>
-            `;
+        function loadMoreFiles() {
+            if (filePageLoading || currentFiles.length >= filesTotal) return;
+            const request = fileListRequest;
+            filePageLoading = true;
             
+            fetchFilePage(currentPath, currentFiles.length)
+                .then(data => {
+                    if (request !== fileListRequest) return;
+                    filePageLoading = false;
+                    if (data.error) {
+                        showNotification(data.error, 'error');
+                        return;
+                    }
+                    filesTotal = data.total;
+                    currentFiles.push(...data.files);
+                    fileRenderStart = fileRenderEnd = -1;
+                    scheduleFileRender();
+                })
+                .catch(error => {
+                    if (request !== fileListRequest) return;
+                    filePageLoading = false;
+                    console.error('Error fetching files:', error);
+                });
+        }
+        
+        // Virtual scrolling: only the rows in view (plus overscan) exist in the DOM;
+        // the #fileRows spacer is sized for the whole list so the scrollbar is right
+        const FILE_ROW_OVERSCAN = 5;
+        let currentFiles = [];
+        let fileRowHeight = 0;
+        let fileRenderStart = -1;
+        let fileRenderEnd = -1;
+        let fileRenderPending = false;
+        let displayedPath = null;
+        // Rendered row nodes keyed by file name; a refresh (e.g. after rename/delete)
+        // reuses the ones whose entry is unchanged instead of rebuilding the window
+        let fileRowCache = new Map();
+        
+        function displayFiles(files, breadcrumbs, relativePath) {
+            // Create breadcrumb navigation; the target path rides along in data-path
+            const crumbs = document.createDocumentFragment();
+            crumbs.appendChild(buildBreadcrumb('🏠 Home', ''));
             breadcrumbs.forEach(crumb => {
-                breadcrumbHtml += `
-                    <span class="breadcrumb-separator">></span>
-                    <button class="breadcrumb-item" onclick="navigateToPath('${crumb.path}')">${crumb.name}</button>
-                `;
+                const separator = document.createElement('span');
+                separator.className = 'breadcrumb-separator';
+                separator.textContent = '>';
+                crumbs.append(separator, buildBreadcrumb(crumb.name, crumb.path));
             });
+            document.getElementById('breadcrumbNav').replaceChildren(crumbs);
+            
+            const status = document.getElementById('fileListStatus');
+            status.textContent = files.length === 0 ? 'No files found' : '';
+            status.style.display = files.length === 0 ? '' : 'none';
+            
+            currentFiles = files;
+            fileRenderStart = fileRenderEnd = -1;
+            if (relativePath !== displayedPath) {
+                // New directory: start at the top; a refresh of the same one keeps its place
+                displayedPath = relativePath;
+                fileRowCache.clear();
+                document.getElementById('fileList').scrollTop = 0;
+            }
+            renderVisibleFiles();
+        }
+        
+        function buildBreadcrumb(label, path) {
+            const button = document.createElement('button');
+            button.className = 'breadcrumb-item';
+            button.dataset.path = path;
+            button.textContent = label;
+            return button;
+        }
+        
+        function renderVisibleFiles() {
+            fileRenderPending = false;
+            const fileList = document.getElementById('fileList');
+            const rows = document.getElementById('fileRows');
+            const rowsWindow = document.getElementById('fileRowsWindow');
             
-            breadcrumbHtml += '</div>';
-            
-            if (files.length === 0) {
-                fileList.innerHTML = breadcrumbHtml + '<div style="text-align: center; opacity: 0.7; padding: 20px;">No files found</div>';
+            if (currentFiles.length === 0) {
+                rowsWindow.replaceChildren();
+                rows.style.height = '0px';
                 return;
             }
             
-            const filesHtml = files.map(file => {
-                const isTextFile = isTextBasedFile(file.name);
-                return `
-                    <div class="file-item">
-                        <div class="file-icon" ${file.is_directory ? `onclick="navigateToFolder('${file.name}')" style="cursor: pointer;"` : ''}>${getFileIcon(file)}</div>
-                        <div class="file-info" ${file.is_directory ? `onclick="navigateToFolder('${file.name}')" style="cursor: pointer;"` : ''}>
-                            <div class="file-name">${file.name}</div>
-                            <div class="file-details">
-                                ${file.is_directory ? 'Directory' : formatFileSize(file.size)} • 
-                                ${new Date(file.modified * 1000).toLocaleString()}
-                            </div>
-                        </div>
-                        <div class="file-actions">
-                            ${file.is_directory ? `<button class="action-btn btn-view" onclick="navigateToFolder('${file.name}')">📁 Open</button>` : ''}
-                            ${!file.is_directory && isTextFile ? `<button class="action-btn btn-view" onclick="viewFile('${file.name}')">👁️ View</button>` : ''}
-                            ${!file.is_directory && isTextFile ? `<button class="action-btn btn-edit" onclick="editFile('${file.name}')">✏️ Edit</button>` : ''}
-                            ${!file.is_directory ? `<button class="action-btn btn-download" onclick="downloadFile('${file.name}')">📥 Download</button>` : ''}
-                            <button class="action-btn btn-rename" onclick="renameFile('${file.name}')">🔄 Rename</button>
-                            <button class="action-btn btn-delete" onclick="deleteFile('${file.name}')">🗑️ Delete</button>
-                        </div>
-                    </div>
-                `;
-            }).join('');
-            
-            fileList.innerHTML = breadcrumbHtml + filesHtml;
+            if (!fileRowHeight) {
+                // Measure one real row (including its margin) to size the list
+                rowsWindow.replaceChildren(buildFileRow(currentFiles[0]));
+                const row = rowsWindow.firstElementChild;
+                fileRowHeight = row.offsetHeight + parseFloat(getComputedStyle(row).marginBottom);
+                fileRenderStart = fileRenderEnd = -1;
+            }
+            rows.style.height = `${currentFiles.length * fileRowHeight}px`;
+            
+            const top = fileList.scrollTop - rows.offsetTop;
+            const start = Math.max(0, Math.floor(top / fileRowHeight) - FILE_ROW_OVERSCAN);
+            const end = Math.min(currentFiles.length,
+                Math.ceil((top + fileList.clientHeight) / fileRowHeight) + FILE_ROW_OVERSCAN);
+            if (end + FILE_ROW_OVERSCAN * 4 >= currentFiles.length) loadMoreFiles();
+            if (start === fileRenderStart && end === fileRenderEnd) return;
+            
+            fileRenderStart = start;
+            fileRenderEnd = end;
+            rowsWindow.style.transform = `translateY(${start * fileRowHeight}px)`;
+            const fragment = document.createDocumentFragment();
+            const rendered = new Map();
+            for (let i = start; i < end; i++) {
+                const file = currentFiles[i];
+                const cached = fileRowCache.get(file.name);
+                const row = cached && isSameFileEntry(cached.file, file) ? cached.row : buildFileRow(file);
+                rendered.set(file.name, { file, row });
+                fragment.appendChild(row);
+            }
+            // Only the rows in the window are kept, so the cache stays window-sized
+            fileRowCache = rendered;
+            rowsWindow.replaceChildren(fragment);
+        }
+        
+        function isSameFileEntry(a, b) {
+            return a.modified === b.modified && a.size === b.size && a.is_directory === b.is_directory;
+        }
+        
+        function scheduleFileRender() {
+            if (!fileRenderPending) {
+                fileRenderPending = true;
+                requestAnimationFrame(renderVisibleFiles);
+            }
         }
         
+        document.getElementById('fileList').addEventListener('scroll', scheduleFileRender, { passive: true });
+        window.addEventListener('resize', () => {
+            fileRowHeight = 0;  // row height depends on the layout width
+            scheduleFileRender();
+        }, { passive: true });
+        
+        // Rows are cloned from #fileItemTpl: no HTML parsing or quote escaping per file
+        const fileItemTpl = document.getElementById('fileItemTpl').content.firstElementChild;
+        // Resolve the locale once; format() takes epoch milliseconds directly
+        const modifiedFormat = new Intl.DateTimeFormat(undefined, { dateStyle: 'short', timeStyle: 'short' });
+        
+        function buildFileRow(file) {
+            const row = fileItemTpl.cloneNode(true);
+            row.dataset.filename = file.name;
+            row.querySelector('.file-icon').textContent = getFileIcon(file);
+            row.querySelector('.file-name').textContent = file.name;
+            row.querySelector('.file-details').textContent =
+                `${file.is_directory ? 'Directory' : formatFileSize(file.size)} • ${modifiedFormat.format(file.modified * 1000)}`;
+            
+            const isTextFile = !file.is_directory && isTextBasedFile(file.name);
+            const actions = row.querySelector('.file-actions');
+            if (file.is_directory) {
+                row.classList.add('is-directory');
+                actions.querySelector('[data-action="view"]').remove();
+                actions.querySelector('[data-action="edit"]').remove();
+                actions.querySelector('[data-action="download"]').remove();
+            } else {
+                actions.querySelector('[data-action="open"]').remove();
+                if (!isTextFile) {
+                    actions.querySelector('[data-action="view"]').remove();
+                    actions.querySelector('[data-action="edit"]').remove();
+                }
+            }
+            return row;
+        }
+        
+        // One delegated listener on #fileList handles breadcrumbs and every row's buttons
+        const fileActions = {
+            open: navigateToFolder,
+            view: viewFile,
+            edit: editFile,
+            download: downloadFile,
+            rename: renameFile,
+            delete: deleteFile
+        };
+        
+        document.getElementById('fileList').addEventListener('click', e => {
+            const crumb = e.target.closest('[data-path]');
+            if (crumb) {
+                navigateToPath(crumb.dataset.path);
+                return;
+            }
+            const row = e.target.closest('.file-item');
+            if (!row) return;
+            const button = e.target.closest('[data-action]');
+            if (button) {
+                fileActions[button.dataset.action](row.dataset.filename);
+            } else if (row.classList.contains('is-directory') && !e.target.closest('.file-actions')) {
+                navigateToFolder(row.dataset.filename);
+            }
+        });
+        
+        // Page-level buttons carry data-command instead of inline onclick handlers
+        const pageCommands = {
+            'toggle-theme': () => toggleTheme(),
+            'refresh': () => refreshFileList(),
+            'select-files': () => document.getElementById('fileInput').click(),
+            'close-modal': () => closeFileModal(),
+            'save': () => saveFile(),
+            'toggle-view': () => toggleViewMode()
+        };
+        
+        document.addEventListener('click', e => {
+            const button = e.target.closest('[data-command]');
+            if (button) {
+                pageCommands[button.dataset.command]();
+            } else if (e.target === document.getElementById('fileModal')) {
+                // Close modal when clicking outside of it
+                closeFileModal();
+            }
+        });
+        
         function navigateToPath(path) {
             refreshFileList(path);
         }
@@ -3867,30 +4894,38 @@ class MinecraftServerWrapper:
             refreshFileList(newPath);
         }
         
+        // No per-call allocation; the server already sends extensions lowercased
         function getFileIcon(file) {
             if (file.is_directory) return '📁';
-            
-            const ext = file.extension.toLowerCase();
-            const iconMap = {
-                '.txt': '📄', '.doc': '📄', '.docx': '📄', '.pdf': '📄',
-                '.jpg': '🖼️', '.jpeg': '🖼️', '.png': '🖼️', '.gif': '🖼️', '.bmp': '🖼️',
-                '.mp4': '🎬', '.avi': '🎬', '.mov': '🎬', '.wmv': '🎬',
-                '.mp3': '🎵', '.wav': '🎵', '.flac': '🎵', '.aac': '🎵',
-                '.zip': '📦', '.rar': '📦', '.7z': '📦', '.tar': '📦',
-                '.exe': '⚙️', '.msi': '⚙️', '.deb': '⚙️', '.dmg': '⚙️',
-                '.js': '💻', '.html': '💻', '.css': '💻', '.py': '💻', '.java': '💻',
-                '.jar': '☕', '.properties': '⚙️', '.yml': '⚙️', '.yaml': '⚙️', '.json': '⚙️'
-            };
-            
-            return iconMap[ext] || '📄';
+            switch (file.extension) {
+                case '.jpg': case '.jpeg': case '.png': case '.gif': case '.bmp':
+                    return '🖼️';
+                case '.mp4': case '.avi': case '.mov': case '.wmv':
+                    return '🎬';
+                case '.mp3': case '.wav': case '.flac': case '.aac':
+                    return '🎵';
+                case '.zip': case '.rar': case '.7z': case '.tar':
+                    return '📦';
+                case '.exe': case '.msi': case '.deb': case '.dmg':
+                case '.properties': case '.yml': case '.yaml': case '.json':
+                    return '⚙️';
+                case '.js': case '.html': case '.css': case '.py': case '.java':
+                    return '💻';
+                case '.jar':
+                    return '☕';
+                default:
+                    // .txt, .doc, .docx, .pdf and everything unknown
+                    return '📄';
+            }
         }
         
+        const SIZE_UNITS = ['Bytes', 'KB', 'MB', 'GB'];
+        const LOG_1024 = Math.log(1024);
+        
         function formatFileSize(bytes) {
             if (bytes === 0) return '0 Bytes';
-            const k = 1024;
-            const sizes = ['Bytes', 'KB', 'MB', 'GB'];
-            const i = Math.floor(Math.log(bytes) / Math.log(k));
-            return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
+            const i = Math.min(Math.floor(Math.log(bytes) / LOG_1024), SIZE_UNITS.length - 1);
+            return parseFloat((bytes / 1024 ** i).toFixed(2)) + ' ' + SIZE_UNITS[i];
         }
         
         function uploadFiles(files) {
@@ -4012,12 +5047,12 @@ class MinecraftServerWrapper:
             }
         }
         
+        const TEXT_EXTENSIONS = new Set(['.txt', '.json', '.properties', '.yml', '.yaml', '.xml', '.cfg', '.conf', 
+                                         '.ini', '.log', '.md', '.py', '.java', '.js', '.html', '.css', '.sql', 
+                                         '.sh', '.bat', '.cmd', '.ps1', '.toml', '.env', '.gitignore', '.dockerfile']);
+        
         function isTextBasedFile(filename) {
-            const textExtensions = ['.txt', '.json', '.properties', '.yml', '.yaml', '.xml', '.cfg', '.conf', 
-                                  '.ini', '.log', '.md', '.py', '.java', '.js', '.html', '.css', '.sql', 
-                                  '.sh', '.bat', '.cmd', '.ps1', '.toml', '.env', '.gitignore', '.dockerfile'];
-            const ext = filename.substring(filename.lastIndexOf('.')).toLowerCase();
-            return textExtensions.includes(ext);
+            return TEXT_EXTENSIONS.has(filename.substring(filename.lastIndexOf('.')).toLowerCase());
         }
         
         let currentFile = null;
@@ -4130,14 +5165,6 @@ class MinecraftServerWrapper:
             isEditMode = false;
         }
         
-        // Close modal when clicking outside of it
-        window.onclick = function(event) {
-            const modal = document.getElementById('fileModal');
-            if (event.target === modal) {
-                closeFileModal();
-            }
-        }
-        
         // Close modal with Escape key
         document.addEventListener('keydown', function(event) {
             if (event.key === 'Escape') {
@@ -4193,10 +5220,207 @@ class MinecraftServerWrapper:
         setTimeout(() => {
             refreshFileList();
         }, 500);
-    </script>
+        '''
+
+    def register_static_asset(self, stem, extension, content, mimetype):
+        """Store an in-memory asset under a content-hashed name and return its URL"""
+        body = content.encode('utf-8')
+        name = f"{stem}.{hashlib.sha1(body).hexdigest()[:12]}.{extension}"
+        self.static_assets[name] = (self.encode_variants(body), mimetype)
+        return f"/assets/{name}"
+
+    def encode_variants(self, body):
+        """Pre-compress a static body once: {content-coding: bytes}"""
+        variants = {'identity': body, 'gzip': gzip.compress(body, 9)}
+        if brotli is not None:
+            variants['br'] = brotli.compress(body, quality=11)
+        return variants
+
+    def encoded_response(self, variants, mimetype):
+        """Build a response from the smallest pre-compressed variant the client accepts"""
+        accepted = request.headers.get('Accept-Encoding', '')
+        coding = 'identity'
+        if 'br' in variants and 'br' in accepted:
+            coding = 'br'
+        elif 'gzip' in accepted:
+            coding = 'gzip'
+        response = Response(variants[coding], mimetype=mimetype)
+        if coding != 'identity':
+            response.headers['Content-Encoding'] = coding
+        return response, coding
+
+    def build_page_cache(self, html):
+        """Return (encoded variants, etag) for a rendered page"""
+        return (self.encode_variants(html), hashlib.md5(html).hexdigest())
+
+    def cached_page_response(self, cached):
+        """Serve a cached page, pre-compressed when accepted, with ETag revalidation"""
+        variants, etag = cached
+        response, coding = self.encoded_response(variants, 'text/html')
+        response.headers['Vary'] = 'Accept-Encoding, Cookie'
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.set_etag(etag if coding == 'identity' else f"{etag}-{coding}")
+        return response.make_conditional(request)
+
+    def setup_web_routes(self):
+        """Setup web server routes"""
+        # The dashboard is compiled once; rendered pages are cached per user/role
+        dashboard_template = self.web_server.jinja_env.from_string(self.get_dashboard_template())
+        # Stylesheet and script live at content-hashed URLs so browsers cache them for good
+        dashboard_css_url = self.register_static_asset('dashboard', 'css', self.get_dashboard_css(), 'text/css')
+        dashboard_js_url = self.register_static_asset('dashboard', 'js', self.get_dashboard_js(), 'application/javascript')
+        files_css_url = self.register_static_asset('files', 'css', self.get_file_manager_css(), 'text/css')
+        files_js_url = self.register_static_asset('files', 'js', self.get_file_manager_js(), 'application/javascript')
+        
+        @self.web_server.route('/assets/<name>')
+        def static_asset(name):
+            asset = self.static_assets.get(name)
+            if asset is None:
+                return "File not found", 404
+            variants, mimetype = asset
+            response, coding = self.encoded_response(variants, mimetype)
+            response.headers['Vary'] = 'Accept-Encoding'
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+            return response
+        
+        @self.web_server.route('/')
+        @self.require_auth
+        def index():
+            # Get current user info
+            user = self.users.get(session['user_id'])
+            username = session['user_id']
+            is_admin = user.get('role') == 'admin'
+            
+            cache_key = (username, is_admin)
+            cached = self.dashboard_cache.get(cache_key)
+            if cached is None:
+                html = dashboard_template.render(
+                    username=username, is_admin=is_admin, use_msgpack=SOCKETIO_USE_MSGPACK,
+                    css_url=dashboard_css_url, js_url=dashboard_js_url
+                ).encode('utf-8')
+                cached = self.build_page_cache(html)
+                self.dashboard_cache[cache_key] = cached
+            return self.cached_page_response(cached)
+        
+        @self.web_server.route('/files')
+        def file_manager():
+            # Only the asset URLs vary, and not per request: render once and serve the cached bytes
+            if self.file_manager_cache is None:
+                html = render_template_string('''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>📁 File Manager - Minecraft Server Wrapper</title>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
+    <link rel="stylesheet" href="{{ css_url }}">
+</head>
+<body>
+    <!-- Theme Toggle Button -->
+    <button class="theme-toggle" data-command="toggle-theme">
+        <span id="theme-icon">🌙</span>
+        <span id="theme-text">Dark Mode</span>
+    </button>
+    
+    <div class="container">
+        <div class="header">
+            <div class="header-content">
+                <div>
+                    <h1>📁 File Manager</h1>
+                    <p>Manage your Minecraft server files with drag-and-drop functionality</p>
+                </div>
+                <div class="nav-buttons">
+                    <a href="/" class="nav-btn">🏠 Dashboard</a>
+                    <a href="/admin" class="nav-btn">👑 Admin Panel</a>
+                    <button class="nav-btn" data-command="refresh">🔄 Refresh</button>
+                </div>
+            </div>
+        </div>
+        
+        <div class="file-manager">
+            <div class="file-controls">
+                <input type="file" id="fileInput" multiple>
+                <button class="btn btn-primary" data-command="select-files">
+                    📤 Select Files
+                </button>
+                <button class="btn btn-success" data-command="refresh">
+                    🔄 Refresh List
+                </button>
+            </div>
+            
+            <div class="drop-zone" id="dropZone">
+                <div class="drop-zone-text">
+                    🎯 Drag and drop files here
+                </div>
+                <div class="drop-zone-subtext">
+                    Or click "Select Files" to browse
+                </div>
+            </div>
+            
+            <div class="upload-progress" id="uploadProgress">
+                <div>Uploading files...</div>
+                <div class="progress-bar">
+                    <div class="progress-fill" id="progressFill"></div>
+                </div>
+            </div>
+            
+            <div class="file-list" id="fileList">
+                <div class="breadcrumb-nav" id="breadcrumbNav"></div>
+                <div class="file-rows" id="fileRows">
+                    <div class="file-rows-window" id="fileRowsWindow"></div>
+                </div>
+                <div class="file-list-status" id="fileListStatus">
+                    Loading files...
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="notification" id="notification"></div>
+    
+    <!-- One file row; cloned per visible entry, unused buttons are removed -->
+    <template id="fileItemTpl">
+        <div class="file-item">
+            <div class="file-icon"></div>
+            <div class="file-info">
+                <div class="file-name"></div>
+                <div class="file-details"></div>
+            </div>
+            <div class="file-actions">
+                <button class="action-btn btn-view" data-action="open">📁 Open</button>
+                <button class="action-btn btn-view" data-action="view">👁️ View</button>
+                <button class="action-btn btn-edit" data-action="edit">✏️ Edit</button>
+                <button class="action-btn btn-download" data-action="download">📥 Download</button>
+                <button class="action-btn btn-rename" data-action="rename">🔄 Rename</button>
+                <button class="action-btn btn-delete" data-action="delete">🗑️ Delete</button>
+            </div>
+        </div>
+    </template>
+    
+    <!-- File Viewer/Editor Modal -->
+    <div class="modal" id="fileModal">
+        <div class="modal-content">
+            <div class="modal-header">
+                <h3 id="modalTitle">View File</h3>
+                <button class="modal-close" data-command="close-modal">&times;</button>
+            </div>
+            <div class="modal-body">
+                <div class="file-editor-controls" id="editorControls" style="display: none;">
+                    <button class="btn btn-success" data-command="save">💾 Save</button>
+                    <button class="btn btn-primary" data-command="toggle-view">👁️ View Mode</button>
+                </div>
+                <textarea id="fileContent" readonly></textarea>
+            </div>
+        </div>
+    </div>
+    
+    <script src="{{ js_url }}"></script>
 </body>
 </html>
-            ''')
+            ''', css_url=files_css_url, js_url=files_js_url).encode('utf-8')
+                self.file_manager_cache = self.build_page_cache(html)
+            return self.cached_page_response(self.file_manager_cache)
         
         # Authentication Routes
         @self.web_server.route('/login', methods=['GET', 'POST'])
@@ -4342,76 +5566,46 @@ class MinecraftServerWrapper:
         @self.require_auth
         def api_start():
             """Start the Minecraft server"""
-            try:
-                if self.server_running:
-                    return jsonify({'error': 'Server is already running'})
-                
-                self.start_server()
-                return jsonify({'message': 'Server start command sent'})
-            except Exception as e:
-                return jsonify({'error': f'Failed to start server: {str(e)}'})
+            result = self.run_control_action('start')
+            return jsonify(result), 202 if 'message' in result else 200
         
         @self.web_server.route('/api/stop', methods=['POST'])
         @self.require_auth
         def api_stop():
             """Stop the Minecraft server"""
-            try:
-                if not self.server_running:
-                    return jsonify({'error': 'Server is not running'})
-                
-                self.stop_server()
-                return jsonify({'message': 'Server stop command sent'})
-            except Exception as e:
-                return jsonify({'error': f'Failed to stop server: {str(e)}'})
+            result = self.run_control_action('stop')
+            return jsonify(result), 202 if 'message' in result else 200
         
         @self.web_server.route('/api/restart', methods=['POST'])
         @self.require_auth
         def api_restart():
             """Restart the Minecraft server"""
-            try:
-                self.restart_server()
-                return jsonify({'message': 'Server restart command sent'})
-            except Exception as e:
-                return jsonify({'error': f'Failed to restart server: {str(e)}'})
+            result = self.run_control_action('restart')
+            return jsonify(result), 202 if 'message' in result else 200
         
         @self.web_server.route('/api/optimize-ram', methods=['POST'])
         @self.require_auth
         def api_optimize_ram():
             """Optimize system RAM"""
-            try:
-                freed_mb = self.optimize_ram()
-                return jsonify({'message': f'RAM optimized! Freed approximately {freed_mb:.1f} MB'})
-            except Exception as e:
-                return jsonify({'error': f'Failed to optimize RAM: {str(e)}'})
+            result = self.run_control_action('optimize-ram')
+            return jsonify(result), 202 if 'message' in result else 200
         
         @self.web_server.route('/api/command', methods=['POST'])
         @self.require_auth
         def api_command():
             """Send command to server"""
-            try:
-                data = request.get_json()
-                command = data.get('command', '').strip()
-                
-                if not command:
-                    return jsonify({'error': 'No command provided'})
-                
-                if not self.server_running:
-                    return jsonify({'error': 'Server is not running'})
-                
-                self.server_process.stdin.write(f"{command}\n")
-                self.server_process.stdin.flush()
-                self.add_console_message(f"> {command}")
-                
-                return jsonify({'message': 'Command sent'})
-            except Exception as e:
-                return jsonify({'error': f'Failed to send command: {str(e)}'})
+            data = request.get_json(silent=True) or {}
+            return jsonify(self.run_control_action('command', data.get('commands', data.get('command'))))
         
         @self.web_server.route('/api/check-updates', methods=['POST'])
         @self.require_auth
         def api_check_updates():
             """Check for application updates"""
             try:
-                update_available = self.check_for_updates(manual=True)
+                future = self.request_update_check(manual=True)
+                if future is None:
+                    return jsonify({'error': 'An update check is already in progress'})
+                update_available = future.result()
                 if update_available:
                     return jsonify({
                         'update_available': True,
@@ -4456,14 +5650,70 @@ class MinecraftServerWrapper:
             except Exception as e:
                 return jsonify({'error': f'Failed to get version info: {str(e)}'})
         
+        @self.web_server.route('/api/performance', methods=['GET'])
+        @self.require_auth
+        def api_performance():
+            """Get current metrics and statistics over the last hour"""
+            try:
+                return jsonify({
+                    'current': self.latest_metrics,
+                    'history': self.get_performance_stats()
+                })
+            except Exception as e:
+                return jsonify({'error': f'Failed to get performance stats: {str(e)}'})
+        
+        @self.web_server.route('/api/console/stream', methods=['GET'])
+        @self.require_auth
+        def api_console_stream():
+            """Stream console lines as Server-Sent Events"""
+            last_event_id = self.parse_console_event_id(request.headers.get('Last-Event-ID'))
+            client_queue = queue.SimpleQueue()
+            # Subscribe and snapshot together so nothing falls between the two
+            with self.console_stream_lock:
+                self.console_stream_clients.add(client_queue)
+                backlog = list(self.console_stream_backlog) if last_event_id is not None else []
+            
+            def generate():
+                last_sent = last_event_id or 0
+                try:
+                    for event_id, entry in backlog:
+                        if event_id > last_sent:
+                            last_sent = event_id
+                            yield f"id: {self.console_run_prefix}{event_id}\ndata: {self.dump_history_entry(entry)}\n"
+                    while True:
+                        try:
+                            event_id, entry = client_queue.get(timeout=15)
+                        except queue.Empty:
+                            yield ": keep-alive\n\n"
+                            continue
+                        if event_id > last_sent:
+                            last_sent = event_id
+                            yield f"id: {self.console_run_prefix}{event_id}\ndata: {self.dump_history_entry(entry)}\n"
+                finally:
+                    with self.console_stream_lock:
+                        self.console_stream_clients.discard(client_queue)
+            
+            response = Response(generate(), mimetype='text/event-stream')
+            response.headers['Cache-Control'] = 'no-cache'
+            response.headers['X-Accel-Buffering'] = 'no'
+            return response
+        
         @self.web_server.route('/api/console', methods=['GET'])
         @self.require_auth
         def api_console():
             """Get console history"""
             try:
+                # Unchanged since the client's copy: skip building the JSON entirely
+                etag = f"{self.console_run_prefix}{self.console_version}"
+                if request.if_none_match.contains(etag):
+                    return '', 304, {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'}
+                
                 # Get the last 100 console entries
-                recent_logs = self.console_history[-100:] if len(self.console_history) > 100 else self.console_history
-                return jsonify({'logs': recent_logs})
+                recent_logs = self.get_recent_console_history(100)
+                response = jsonify({'logs': recent_logs})
+                response.set_etag(etag)
+                response.headers['Cache-Control'] = 'no-cache'
+                return response
             except Exception as e:
                 return jsonify({'error': f'Failed to get console logs: {str(e)}'})
         
@@ -4471,25 +5721,18 @@ class MinecraftServerWrapper:
         @self.web_server.route('/api/files', methods=['GET'])
         @self.require_auth
         def api_files():
-            """Get list of files in the managed directory"""
+            """Get one page of the files in the managed directory"""
             try:
                 # Get the requested path from query parameters
                 requested_path = request.args.get('path', '')
+                # Paging is opt-in: without offset/limit the whole listing is returned as before
+                paged = 'offset' in request.args or 'limit' in request.args
+                offset = max(0, request.args.get('offset', 0, type=int))
+                limit = min(max(1, request.args.get('limit', 200, type=int)), 1000)
+                sort = request.args.get('sort', 'name')
                 
-                # Start with the server directory as the base
                 base_path = self.server_directory
-                
-                # If a path is requested, join it with the base path
-                if requested_path:
-                    # Normalize and validate the requested path
-                    requested_path = requested_path.replace('\\', '/').strip('/')
-                    if requested_path and not requested_path.startswith('..'):
-                        file_manager_path = os.path.join(base_path, requested_path)
-                        file_manager_path = os.path.normpath(file_manager_path)
-                    else:
-                        file_manager_path = base_path
-                else:
-                    file_manager_path = base_path
+                file_manager_path = self.resolve_file_manager_path(requested_path)
                 
                 # Security check: ensure the path is within the server directory
                 if not self.is_safe_path(file_manager_path, base_path):
@@ -4501,25 +5744,32 @@ class MinecraftServerWrapper:
                 if not os.path.isdir(file_manager_path):
                     return jsonify({'error': 'Path is not a directory'}), 400
                 
+                # scandir hands back the type (and on Windows the stat) from the directory read
                 files = []
-                for item in os.listdir(file_manager_path):
-                    item_path = os.path.join(file_manager_path, item)
-                    try:
-                        stat = os.stat(item_path)
-                        
-                        files.append({
-                            'name': item,
-                            'size': stat.st_size,
-                            'modified': stat.st_mtime,
-                            'is_directory': os.path.isdir(item_path),
-                            'extension': os.path.splitext(item)[1].lower() if not os.path.isdir(item_path) else ''
-                        })
-                    except (OSError, PermissionError):
-                        # Skip files we can't access
-                        continue
+                with os.scandir(file_manager_path) as entries:
+                    for entry in entries:
+                        try:
+                            is_directory = entry.is_dir()
+                            stat = entry.stat()
+                            
+                            files.append({
+                                'name': entry.name,
+                                'size': stat.st_size,
+                                'modified': stat.st_mtime,
+                                'is_directory': is_directory,
+                                'extension': '' if is_directory else os.path.splitext(entry.name)[1].lower()
+                            })
+                        except (OSError, PermissionError):
+                            # Skip files we can't access
+                            continue
                 
-                # Sort files: directories first, then by name
+                # Sort files: directories first, then by name (or newest/largest first)
                 files.sort(key=lambda x: (not x['is_directory'], x['name'].lower()))
+                if sort in ('modified', 'size'):
+                    files.sort(key=lambda x: (x['is_directory'], x[sort]), reverse=True)
+                total = len(files)
+                if paged:
+                    files = files[offset:offset + limit]
                 
                 # Calculate relative path for display
                 relative_path = os.path.relpath(file_manager_path, base_path)
@@ -4540,6 +5790,8 @@ class MinecraftServerWrapper:
                 
                 return jsonify({
                     'files': files, 
+                    'total': total,
+                    'offset': offset,
                     'path': file_manager_path,
                     'relative_path': relative_path.replace('\\', '/') if relative_path else '',
                     'breadcrumbs': breadcrumbs
@@ -4555,31 +5807,22 @@ class MinecraftServerWrapper:
                 # Get the current path from form data
                 current_path = request.form.get('path', '')
                 
-                # Start with the server directory as the base
                 base_path = self.server_directory
-                
-                # If a path is provided, join it with the base path
-                if current_path:
-                    # Normalize and validate the requested path
-                    current_path = current_path.replace('\\', '/').strip('/')
-                    if current_path and not current_path.startswith('..'):
-                        file_manager_path = os.path.join(base_path, current_path)
-                        file_manager_path = os.path.normpath(file_manager_path)
-                    else:
-                        file_manager_path = base_path
-                else:
-                    file_manager_path = base_path
+                file_manager_path = self.resolve_file_manager_path(current_path)
                 
                 # Security check: ensure the path is within the server directory
                 if not self.is_safe_path(file_manager_path, base_path):
                     return jsonify({'error': 'Invalid path'}), 403
                 
-                if not os.path.exists(file_manager_path):
-                    os.makedirs(file_manager_path, exist_ok=True)
+                os.makedirs(file_manager_path, exist_ok=True)
                 
                 if 'files' not in request.files:
                     return jsonify({'error': 'No files provided'})
                 
+                # One directory read up front; duplicate names are then resolved in memory
+                with os.scandir(file_manager_path) as entries:
+                    existing_names = {os.path.normcase(entry.name) for entry in entries}
+                
                 uploaded_files = []
                 for file in request.files.getlist('files'):
                     if file.filename == '':
@@ -4596,19 +5839,20 @@ class MinecraftServerWrapper:
                     if not self.is_safe_path(file_path, base_path):
                         continue
                     
-                    # Handle duplicate filenames
+                    # Handle duplicate filenames (normcase: Windows names are case-insensitive)
                     counter = 1
                     original_name, ext = os.path.splitext(filename)
-                    while os.path.exists(file_path):
+                    while os.path.normcase(filename) in existing_names:
                         filename = f"{original_name}_{counter}{ext}"
-                        file_path = os.path.join(file_manager_path, filename)
-                        if not self.is_safe_path(file_path, base_path):
-                            break
                         counter += 1
+                    file_path = os.path.join(file_manager_path, filename)
                     
                     # Final security check before saving
                     if self.is_safe_path(file_path, base_path):
-                        file.save(file_path)
+                        # 1 MiB copies instead of the 16 KiB default: large jars and world
+                        # archives reach the disk in far fewer read/write calls
+                        file.save(file_path, buffer_size=1024 * 1024)
+                        existing_names.add(os.path.normcase(filename))
                         uploaded_files.append(filename)
                 
                 if uploaded_files:
@@ -4639,20 +5883,8 @@ class MinecraftServerWrapper:
                 if not old_name or not new_name:
                     return jsonify({'error': 'Invalid filename provided'})
                 
-                # Start with the server directory as the base
                 base_path = self.server_directory
-                
-                # If a path is provided, join it with the base path
-                if current_path:
-                    # Normalize and validate the requested path
-                    current_path = current_path.replace('\\', '/').strip('/')
-                    if current_path and not current_path.startswith('..'):
-                        file_manager_path = os.path.join(base_path, current_path)
-                        file_manager_path = os.path.normpath(file_manager_path)
-                    else:
-                        file_manager_path = base_path
-                else:
-                    file_manager_path = base_path
+                file_manager_path = self.resolve_file_manager_path(current_path)
                 
                 old_path = os.path.join(file_manager_path, old_name)
                 new_path = os.path.join(file_manager_path, new_name)
@@ -4690,20 +5922,8 @@ class MinecraftServerWrapper:
                 if not filename:
                     return jsonify({'error': 'Invalid filename provided'})
                 
-                # Start with the server directory as the base
                 base_path = self.server_directory
-                
-                # If a path is provided, join it with the base path
-                if current_path:
-                    # Normalize and validate the requested path
-                    current_path = current_path.replace('\\', '/').strip('/')
-                    if current_path and not current_path.startswith('..'):
-                        file_manager_path = os.path.join(base_path, current_path)
-                        file_manager_path = os.path.normpath(file_manager_path)
-                    else:
-                        file_manager_path = base_path
-                else:
-                    file_manager_path = base_path
+                file_manager_path = self.resolve_file_manager_path(current_path)
                 
                 file_path = os.path.join(file_manager_path, filename)
                 
@@ -4740,20 +5960,8 @@ class MinecraftServerWrapper:
                 # Get the current path from query parameters
                 current_path = request.args.get('path', '')
                 
-                # Start with the server directory as the base
                 base_path = self.server_directory
-                
-                # If a path is provided, join it with the base path
-                if current_path:
-                    # Normalize and validate the requested path
-                    current_path = current_path.replace('\\', '/').strip('/')
-                    if current_path and not current_path.startswith('..'):
-                        file_manager_path = os.path.join(base_path, current_path)
-                        file_manager_path = os.path.normpath(file_manager_path)
-                    else:
-                        file_manager_path = base_path
-                else:
-                    file_manager_path = base_path
+                file_manager_path = self.resolve_file_manager_path(current_path)
                 
                 file_path = os.path.join(file_manager_path, filename)
                 
@@ -4767,7 +5975,10 @@ class MinecraftServerWrapper:
                 if os.path.isdir(file_path):
                     return jsonify({'error': 'Cannot download directories'}), 400
                 
-                return send_file(file_path, as_attachment=True, download_name=filename)
+                # Conditional: a repeat download with If-None-Match/If-Modified-Since gets a 304,
+                # and Range requests let interrupted downloads resume
+                return send_file(file_path, as_attachment=True, download_name=filename,
+                                 conditional=True, etag=True)
                 
             except Exception as e:
                 return jsonify({'error': f'Failed to download file: {str(e)}'}), 500
@@ -4785,20 +5996,8 @@ class MinecraftServerWrapper:
                 # Get the current path from query parameters
                 current_path = request.args.get('path', '')
                 
-                # Start with the server directory as the base
                 base_path = self.server_directory
-                
-                # If a path is provided, join it with the base path
-                if current_path:
-                    # Normalize and validate the requested path
-                    current_path = current_path.replace('\\', '/').strip('/')
-                    if current_path and not current_path.startswith('..'):
-                        file_manager_path = os.path.join(base_path, current_path)
-                        file_manager_path = os.path.normpath(file_manager_path)
-                    else:
-                        file_manager_path = base_path
-                else:
-                    file_manager_path = base_path
+                file_manager_path = self.resolve_file_manager_path(current_path)
                 
                 file_path = os.path.join(file_manager_path, filename)
                 
@@ -4913,18 +6112,36 @@ class MinecraftServerWrapper:
                 return jsonify({'error': f'Failed to edit file: {str(e)}'})
         
     # Helper function for secure file path validation
+    def resolve_file_manager_path(self, relative_path):
+        """Join a client-supplied directory onto the server directory (checked by is_safe_path)"""
+        base_path = self.server_directory
+        relative_path = (relative_path or '').replace('\\', '/').strip('/')
+        if relative_path and not relative_path.startswith('..'):
+            return os.path.normpath(os.path.join(base_path, relative_path))
+        return base_path
+    
     def is_safe_path(self, path, base_path):
         """Validate that a file path is safe and within the base directory"""
         try:
-            # Resolve both paths to absolute paths
-            abs_path = os.path.abspath(path)
-            abs_base = os.path.abspath(base_path)
+            # Resolve symlinks and '..' so neither can step outside the base directory
+            abs_path = os.path.realpath(path)
+            abs_base = self.resolve_base_path(base_path)
             
-            # Check if the resolved path is within the base directory
-            return abs_path.startswith(abs_base + os.sep) or abs_path == abs_base
+            # commonpath compares whole components (and case-insensitively on Windows);
+            # paths on different drives raise ValueError and are rejected below
+            return os.path.commonpath([abs_path, abs_base]) == abs_base
         except Exception:
             return False
     
+    def resolve_base_path(self, base_path):
+        """Return the canonical form of a base directory, resolving it once per value"""
+        cached_base, resolved = self.resolved_base_cache
+        if base_path != cached_base:
+            resolved = os.path.realpath(base_path)
+            # One tuple assignment, so request threads never see a mismatched pair
+            self.resolved_base_cache = (base_path, resolved)
+        return resolved
+    
     def sanitize_filename(self, filename):
         """Sanitize filename to prevent directory traversal and invalid characters"""
         if not filename:
@@ -4937,8 +6154,7 @@ class MinecraftServerWrapper:
         filename = filename.replace('\\', '')
         
         # Remove control characters and other dangerous chars
-        import re
-        filename = re.sub(r'[<>:"|?*\x00-\x1f]', '', filename)
+        filename = UNSAFE_FILENAME_CHARS.sub('', filename)
         
         # Ensure filename is not empty after sanitization
         if not filename.strip():
@@ -4966,27 +6182,36 @@ class MinecraftServerWrapper:
 
     def setup_socketio_events(self):
         """Setup Socket.IO event handlers"""
-        # Auto-check for updates periodically
-        def auto_update_check():
-            while True:
-                try:
-                    self.auto_check_updates()
-                    time.sleep(self.update_check_interval)
-                except Exception as e:
-                    print(f"Auto update check error: {e}")
-                    time.sleep(300)  # Wait 5 minutes on error
+        # Auto-check for updates periodically; a Tk timer instead of a parked thread
+        self.root.after(0, self.auto_check_updates)
         
-        # Start auto-update check thread
-        threading.Thread(target=auto_update_check, daemon=True).start()
+        # Start the batched console emitter
+        threading.Thread(target=self.console_batch_loop, daemon=True).start()
         
         # Socket.IO events
         @self.socketio.on('connect')
-        def handle_connect():
+        def handle_connect(auth=None):
             print(f"Client connected: {request.sid}")
+            self.web_clients.add(request.sid)
+            
+            # Give only the new client a full snapshot; later deltas are within their
+            # thresholds of it, so the shared baseline (owned by the monitor thread) stays put
+            if self.latest_metrics is not None:
+                self.socketio.emit('performance_update', dict(self.latest_metrics, keyframe=True), room=request.sid)
+            
+            # Send console history to newly connected client, deflated once when the
+            # browser can inflate it natively and it's big enough to be worth it
+            recent_logs = self.get_recent_console_history(100)
+            payload = None
+            if isinstance(auth, dict) and auth.get('inflate'):
+                payload = orjson.dumps(recent_logs) if orjson else json.dumps(recent_logs).encode('utf-8')
+            if payload is not None and len(payload) > 1024:
+                self.socketio.emit('console_history_z', zlib.compress(payload, 6), room=request.sid)
+            else:
+                self.socketio.emit('console_history', recent_logs, room=request.sid)
             
-            # Send console history to newly connected client
-            recent_logs = self.console_history[-100:] if len(self.console_history) > 100 else self.console_history
-            self.socketio.emit('console_history', recent_logs, room=request.sid)
+            # Send current server status to newly connected client
+            self.socketio.emit('status_change', {'running': self.server_running}, room=request.sid)
             
             # Send current update status to newly connected client
             if self.update_available:
@@ -4998,6 +6223,15 @@ class MinecraftServerWrapper:
         @self.socketio.on('disconnect')
         def handle_disconnect():
             print(f"Client disconnected: {request.sid}")
+            self.web_clients.discard(request.sid)
+        
+        @self.socketio.on('control')
+        def handle_control(action, payload=None):
+            """Server controls over the open socket; the return value is the ack"""
+            if not self.is_authenticated():
+                return {'error': 'Authentication required'}
+            command = payload.get('commands', payload.get('command')) if isinstance(payload, dict) else None
+            return self.run_control_action(action, command)
 
     def emit_update_notification(self, message_type, data):
         """Emit update notifications to all connected clients"""
@@ -5015,6 +6249,8 @@ class MinecraftServerWrapper:
                     self.server_jar = config.get('server_jar', '')
                     self.min_memory = config.get('min_memory', '1G')
                     self.max_memory = config.get('max_memory', '2G')
+                    self.github_etag = config.get('github_etag')
+                    self.github_last_modified = config.get('github_last_modified')
         except Exception as e:
             print(f"Error loading config: {e}")
 
@@ -5024,10 +6260,11 @@ class MinecraftServerWrapper:
             config = {
                 'server_jar': self.server_jar,
                 'min_memory': self.min_memory,
-                'max_memory': self.max_memory
+                'max_memory': self.max_memory,
+                'github_etag': self.github_etag,
+                'github_last_modified': self.github_last_modified
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            self.write_json_file(self.config_file, config, 4)
         except Exception as e:
             print(f"Error saving config: {e}")
 
@@ -5035,25 +6272,86 @@ class MinecraftServerWrapper:
         """Load console history from file"""
         try:
             if os.path.exists(self.console_history_file):
+                line_count = 0
+                recent_lines = deque(maxlen=self.console_history_limit)
                 with open(self.console_history_file, 'r', encoding='utf-8') as f:
-                    self.console_history = json.load(f)
+                    for line in f:
+                        line_count += 1
+                        recent_lines.append(line)
+                
+                self.console_history = deque(maxlen=self.console_history_limit)
+                for line in recent_lines:
+                    try:
+                        self.console_history.append(json.loads(line))
+                    except ValueError:
+                        pass  # partial line from an interrupted write
+                
+                # The file only grows; compact it once it holds far more than we keep
+                if line_count > 2 * self.console_history_limit:
+                    self.compact_console_history()
+            elif os.path.exists(self.legacy_console_history_file):
+                # Migrate the old single-document history to the JSON-lines file
+                with open(self.legacy_console_history_file, 'r', encoding='utf-8') as f:
+                    self.console_history = deque(json.load(f), maxlen=self.console_history_limit)
+                self.console_history_pending.extend(self.console_history)
         except Exception as e:
             print(f"Error loading console history: {e}")
-            self.console_history = []
+            self.console_history = deque(maxlen=self.console_history_limit)
+
+    def dump_history_entry(self, entry):
+        """Serialize one console history entry as a JSON line"""
+        if orjson is not None:
+            return orjson.dumps(entry).decode('utf-8') + '\n'
+        return json.dumps(entry, ensure_ascii=False) + '\n'
+
+    def compact_console_history(self):
+        """Rewrite the history file with only the entries kept in memory"""
+        with self.console_history_lock:
+            temp_file = self.console_history_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(''.join(self.dump_history_entry(entry) for entry in list(self.console_history)))
+            os.replace(temp_file, self.console_history_file)
+
+    def get_recent_console_history(self, count):
+        """Return the last `count` console history entries as a list"""
+        skip = max(0, len(self.console_history) - count)
+        return list(islice(self.console_history, skip, None))
 
     def save_console_history(self):
-        """Save console history to file"""
-        try:
-            with open(self.console_history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.console_history, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving console history: {e}")
+        """Append console messages logged since the last save to the history file"""
+        with self.console_history_lock:
+            lines = []
+            while self.console_history_pending:
+                lines.append(self.dump_history_entry(self.console_history_pending.popleft()))
+            if not lines:
+                return
+            try:
+                with open(self.console_history_file, 'a', encoding='utf-8') as f:
+                    f.write(''.join(lines))
+            except Exception as e:
+                print(f"Error saving console history: {e}")
+
+    def start_history_saver(self):
+        """Start the thread that writes console history to disk when it changes"""
+        threading.Thread(target=self.history_saver_loop, daemon=True).start()
+
+    def history_saver_loop(self):
+        """Flush pending console history at most once per save interval"""
+        while True:
+            # Sleep until something is logged, then let the burst accumulate
+            self.console_history_ready.wait()
+            time.sleep(self.history_save_interval)
+            self.console_history_ready.clear()
+            self.save_console_history()
 
     def on_closing(self):
         """Handle window closing"""
         self.save_config()
         self.save_console_history()
         self.monitoring_active = False
+        self.monitor_stop.set()
+        self.control_executor.shutdown(wait=False)
+        self.update_executor.shutdown(wait=False, cancel_futures=True)
         
         if self.server_running:
             result = messagebox.askyesno("Confirm Exit", 
@@ -1,10 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
+import tkinter.font as tkfont
 import subprocess
 import threading
+import queue
 import os
 import json
 import time
+import locale
 from datetime import datetime
 import webbrowser
 import sys
@@ -32,17 +35,27 @@ class MinecraftServerWrapper:
         self.root.resizable(True, True)
         self.root.minsize(700, 500)
         
-        # Set default font
-        self.default_font = ("Segoe UI", 10)
-        self.title_font = ("Segoe UI", 16, "bold")
-        self.button_font = ("Segoe UI", 10, "bold")
-        self.label_font = ("Segoe UI", 10)
-        self.console_font = ("Consolas", 10)
+        # Named fonts: each is one Tk font object shared by every widget that uses it
+        self.default_font = tkfont.Font(root=self.root, family="Segoe UI", size=10)
+        self.title_font = tkfont.Font(root=self.root, family="Segoe UI", size=16, weight="bold")
+        self.section_font = tkfont.Font(root=self.root, family="Segoe UI", size=12, weight="bold")
+        self.button_font = tkfont.Font(root=self.root, family="Segoe UI", size=10, weight="bold")
+        self.label_font = self.default_font
+        self.console_font = tkfont.Font(root=self.root, family="Consolas", size=10)
+        
+        # Console lines from any thread; the Tk thread drains them on a timer
+        self.log_queue = queue.SimpleQueue()
+        self.log_drain_interval = 50  # milliseconds
+        self.console_max_lines = 5000  # older lines are trimmed from the widget
+        self.timestamp_cache = (None, '')  # (epoch second, 'HH:MM:SS') of the last log line
         
         # Server process
         self.server_process = None
         self.server_running = False
         self.server_start_time = None
+        self.stdin_lock = threading.Lock()  # Tk and web threads both write commands
+        self.server_encoding = locale.getpreferredencoding(False)  # what text mode used to decode with
+        self.max_partial_line = 64 * 1024  # flush output without a newline once it gets this long
         self.startup_enabled_var = tk.BooleanVar()
         
         # Player tracking
@@ -68,13 +81,13 @@ class MinecraftServerWrapper:
         self.web_port = 5000
         
         # Configuration
-        self.config_file = "server_config.json"
+        self.config_file = os.path.abspath("server_config.json")  # fixed even if the CWD changes
         self.load_config()
         
         # Console history storage
         self.console_history = []
         self.max_console_history = 1000
-        self.console_history_file = "console_history.json"
+        self.console_history_file = os.path.abspath("console_history.json")
         self.load_console_history()
         
         # Check actual startup status and sync with config
@@ -91,6 +104,7 @@ class MinecraftServerWrapper:
         self.web_port = self.config.get("web_port", 5000)
         
         self.setup_ui()
+        self.root.after(self.log_drain_interval, self.drain_log_queue)
         
         # Bind window close event to save configuration
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -114,21 +128,25 @@ class MinecraftServerWrapper:
             "web_port": 5000
         }
         
+        # Text last read from / written to disk; save_config skips writes that match it
+        self.saved_config_text = None
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
-            else:
-                self.config = default_config
+            with open(self.config_file, 'r') as f:
+                self.config = json.load(f)
+            self.saved_config_text = json.dumps(self.config, indent=4)
         except:
             self.config = default_config
     
     def save_config(self):
-        """Save server configuration to file"""
+        """Save server configuration to file (only when it changed)"""
         self.config["startup_enabled"] = self.startup_enabled_var.get()
         try:
+            config_text = json.dumps(self.config, indent=4)
+            if config_text == self.saved_config_text:
+                return
             with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+                f.write(config_text)
+            self.saved_config_text = config_text
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save config: {str(e)}")
     
@@ -155,13 +173,23 @@ class MinecraftServerWrapper:
         except Exception as e:
             print(f"Could not save console history: {e}")
     
+    def get_timestamp(self, now):
+        """Return 'HH:MM:SS' for an epoch time, formatting it at most once per second"""
+        second = int(now)
+        cached_second, cached_text = self.timestamp_cache
+        if second != cached_second:
+            cached_text = time.strftime("%H:%M:%S", time.localtime(second))
+            # One tuple assignment, so threads never see a mismatched pair
+            self.timestamp_cache = (second, cached_text)
+        return cached_text
+    
     def add_to_console_history(self, message):
         """Add message to console history"""
-        timestamp = time.strftime("%H:%M:%S")
+        now = time.time()
         entry = {
-            "timestamp": timestamp,
+            "timestamp": self.get_timestamp(now),
             "message": message,
-            "time": time.time()
+            "time": now
         }
         self.console_history.append(entry)
         
@@ -187,7 +215,7 @@ class MinecraftServerWrapper:
         controls_frame.pack(fill=tk.X, pady=(0, 10))
         
         controls_title = tk.Label(controls_frame, text="Server Controls", 
-                                 font=(self.label_font[0], 12, "bold"), fg="#ecf0f1", bg="#34495e")
+                                 font=self.section_font, fg="#ecf0f1", bg="#34495e")
         controls_title.pack(pady=5)
         
         # Buttons frame
@@ -220,7 +248,7 @@ class MinecraftServerWrapper:
         config_frame.pack(fill=tk.X, pady=(0, 10))
         
         config_title = tk.Label(config_frame, text="Server Configuration",
-                               font=(self.label_font[0], 12, "bold"), fg="#ecf0f1", bg="#34495e")
+                               font=self.section_font, fg="#ecf0f1", bg="#34495e")
         config_title.pack(pady=5)
         
         # Configuration grid
@@ -262,13 +290,14 @@ class MinecraftServerWrapper:
         console_frame.pack(fill=tk.BOTH, expand=True)
         
         console_title = tk.Label(console_frame, text="Server Console",
-                                font=(self.label_font[0], 12, "bold"), fg="#ecf0f1", bg="#34495e")
+                                font=self.section_font, fg="#ecf0f1", bg="#34495e")
         console_title.pack(pady=5)
         
         self.console_output = scrolledtext.ScrolledText(console_frame, height=15,
                                                        bg="#1a1a1a", fg="#00ff00",
                                                        font=self.console_font,
-                                                       insertbackground="#00ff00")
+                                                       insertbackground="#00ff00",
+                                                       undo=False, state=tk.DISABLED)
         self.console_output.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
         
         # Command input frame
@@ -347,20 +376,17 @@ class MinecraftServerWrapper:
         ]
         
         try:
-            # Change to server directory
+            # Run the server from its own directory without moving the wrapper's CWD
             server_dir = os.path.dirname(jar_file)
-            if server_dir:
-                os.chdir(server_dir)
             
             # Start server process
             self.server_process = subprocess.Popen(
                 command,
+                cwd=server_dir or None,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 stdin=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=1024 * 1024  # bytes mode: output is split and decoded in bulk
             )
             
             self.server_running = True
@@ -386,8 +412,7 @@ class MinecraftServerWrapper:
         try:
             if self.server_process:
                 # Send stop command
-                self.server_process.stdin.write("stop\\n")
-                self.server_process.stdin.flush()
+                self.write_server_stdin("stop")
                 
                 # Wait for graceful shutdown
                 try:
@@ -426,38 +451,64 @@ class MinecraftServerWrapper:
             return
         
         try:
-            self.server_process.stdin.write(command + "\\n")
-            self.server_process.stdin.flush()
+            self.write_server_stdin(command)
             self.log_message(f"[COMMAND] {command}")
             self.command_entry.delete(0, tk.END)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to send command: {str(e)}")
     
+    def write_server_stdin(self, command):
+        """Send one command line to the server; writes from different threads never interleave"""
+        with self.stdin_lock:
+            self.server_process.stdin.write((command + "\n").encode(self.server_encoding, 'replace'))
+            self.server_process.stdin.flush()
+    
     def monitor_output(self):
         """Monitor server output"""
+        pending = bytearray()
         while self.server_running and self.server_process:
             try:
-                line = self.server_process.stdout.readline()
-                if line:
-                    line = line.strip()
-                    self.log_message(line)
-                    self.add_to_console_history(line)
-                    
-                    # Check for player join/leave
-                    self.parse_player_activity(line)
-                    
-                elif self.server_process.poll() is not None:
-                    # Process has ended
+                # Whatever is available, up to 64 KiB; empty means the process has ended
+                chunk = self.server_process.stdout.read1(65536)
+                if not chunk:
                     break
+                
+                pending += chunk
+                end = pending.rfind(b'\n')
+                if end < 0:
+                    # e.g. a progress bar redrawn with '\r' only; don't buffer it forever
+                    if len(pending) >= self.max_partial_line:
+                        self.handle_output_line(pending.decode(self.server_encoding, 'replace'))
+                        pending.clear()
+                    continue
+                
+                # Decode all complete lines of the chunk at once; keep the partial tail
+                text = pending[:end].decode(self.server_encoding, 'replace')
+                del pending[:end + 1]
+                for line in text.split('\n'):
+                    self.handle_output_line(line)
                     
             except Exception as e:
                 self.log_message(f"Error reading output: {str(e)}")
                 break
         
+        if pending:
+            self.handle_output_line(pending.decode(self.server_encoding, 'replace'))
+        
         # Server has stopped
         self.server_running = False
         self.root.after(0, self.update_button_states)
-        self.root.after(0, lambda: self.log_message("Server process ended"))
+        self.log_message("Server process ended")
+    
+    def handle_output_line(self, line):
+        """Log one line of server output and track player activity"""
+        # rstrip only: keeps the indentation of stack traces and multi-line output
+        line = line.rstrip()
+        self.log_message(line)
+        self.add_to_console_history(line)
+        
+        # Check for player join/leave
+        self.parse_player_activity(line)
     
     def parse_player_activity(self, line):
         """Parse player join/leave messages"""
@@ -478,18 +529,31 @@ class MinecraftServerWrapper:
             return
     
     def log_message(self, message):
-        """Log message to console"""
-        timestamp = time.strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
+        """Log message to console (safe from any thread)"""
+        self.log_queue.put(f"[{self.get_timestamp(time.time())}] {message}")
+    
+    def drain_log_queue(self):
+        """Write every queued console line to the widget in one insert (Tk thread)"""
+        lines = []
+        while True:
+            try:
+                lines.append(self.log_queue.get_nowait())
+            except queue.Empty:
+                break
         
-        def update_console():
-            self.console_output.insert(tk.END, formatted_message + "\\n")
+        if lines:
+            self.console_output.config(state=tk.NORMAL)
+            self.console_output.insert(tk.END, "\n".join(lines) + "\n")
+            
+            # Keep the widget bounded; deleting in one range is cheap, per line is not
+            line_count = int(self.console_output.index('end-1c').split('.')[0])
+            if line_count > self.console_max_lines:
+                self.console_output.delete('1.0', f'{line_count - self.console_max_lines}.0')
+            
+            self.console_output.config(state=tk.DISABLED)
             self.console_output.see(tk.END)
         
-        if threading.current_thread() == threading.main_thread():
-            update_console()
-        else:
-            self.root.after(0, update_console)
+        self.root.after(self.log_drain_interval, self.drain_log_queue)
     
     def update_button_states(self):
         """Update button states based on server status"""
@@ -691,9 +755,8 @@ class MinecraftServerWrapper:
                 return jsonify({'error': 'Server is not running'})
             
             try:
-                self.server_process.stdin.write(command + "\\n")
-                self.server_process.stdin.flush()
-                self.root.after(0, lambda: self.log_message(f"[WEB] {command}"))
+                self.write_server_stdin(command)
+                self.log_message(f"[WEB] {command}")
                 return jsonify({'message': 'Command sent'})
             except Exception as e:
                 return jsonify({'error': f'Failed to send command: {str(e)}'})